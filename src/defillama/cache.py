@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional, Tuple
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body and the monotonic time it stops being fresh"""
+
+    content: bytes
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of raw response bodies with a per-entry TTL.
+
+    Entries that are past their TTL are kept for a further `stale_ttl` seconds and
+    returned flagged as stale, so callers can serve them immediately while a fresh
+    copy is fetched in the background (stale-while-revalidate).
+
+    Args:
+        maxsize (int): Maximum number of responses kept before the least recently used is evicted
+        stale_ttl (float): Seconds an expired entry may still be served as stale
+    """
+
+    def __init__(self, maxsize: int = 4096, stale_ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._data: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[Optional[bytes], bool]:
+        """
+        Look up a cached response body.
+
+        Returns:
+            Tuple[Optional[bytes], bool]: The cached body (None on a miss) and whether it is still fresh
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None, False
+            if now >= entry.expires_at + self.stale_ttl:
+                del self._data[key]
+                return None, False
+            self._data.move_to_end(key)
+            return entry.content, now < entry.expires_at
+
+    def set(self, key: Hashable, content: bytes, ttl: float) -> None:
+        """Store a response body for `ttl` seconds (use math.inf for immutable data)."""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = CacheEntry(content, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
@@ -1,9 +1,262 @@
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import math
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+import anyio
 import httpx
-from typing import List, Optional, Dict, Any, Literal
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Concatenate,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    ParamSpec,
+    Protocol,
+    TYPE_CHECKING,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from anyio.abc import TaskGroup
 
 from . import models
+from .cache import ResponseCache
+
+# Optional extras; type checkers see them installed (the dev group includes every
+# extra), at runtime they fall back to None
+if TYPE_CHECKING:
+    import diskcache
+    import hishel
+    import ijson
+    import orjson
+else:
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional speedup
+        orjson = None
+
+    try:
+        import ijson
+    except ImportError:  # pragma: no cover - optional streaming support
+        ijson = None
+
+    try:
+        import hishel
+    except ImportError:  # pragma: no cover - optional HTTP cache
+        hishel = None
+
+    try:
+        import diskcache
+    except ImportError:  # pragma: no cover - optional on-disk cache
+        diskcache = None
+
+T = TypeVar("T")
+P = ParamSpec("P")
+R = TypeVar("R")
+R_co = TypeVar("R_co", covariant=True)
+
+try:
+    _VERSION = importlib.metadata.version("defillama")
+except importlib.metadata.PackageNotFoundError:  # pragma: no cover - not installed
+    _VERSION = "0.0.0"
+
+# httpx only decodes brotli when brotli/brotlicffi is installed, so only advertise it then
+_HAS_BROTLI = any(
+    importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi")
+)
+
+_DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "br, gzip" if _HAS_BROTLI else "gzip",
+    "User-Agent": f"defillama-py/{_VERSION}",
+}
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize `obj` to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON body that isn't validated by pydantic, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return from_json(content)
+
+
+class _Call(Generic[R]):
+    """
+    The GET request an endpoint method resolves to, typed by what its body parses into.
+
+    `ttl`, when set, overrides the endpoint's cache TTL for this one request.
+    """
+
+    __slots__ = ("host", "path", "params", "ttl")
+
+    def __init__(
+        self,
+        host: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.host = host
+        self.path = path
+        self.params = params
+        self.ttl = ttl
+
+
+class _Flight:
+    """An async request in flight that identical requests wait on instead of resending"""
+
+    __slots__ = ("done", "content", "error")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.content: Optional[bytes] = None
+        self.error: Optional[Exception] = None
+
+
+class _AsyncEndpoint(Protocol[P, R_co]):
+    """The async twin of an `_Endpoint`, bound on the class as `<name>_async`"""
+
+    @overload
+    def __get__(
+        self, obj: None, owner: Any = None
+    ) -> Callable[Concatenate[DefiLlama, P], Coroutine[Any, Any, R_co]]: ...
+    @overload
+    def __get__(
+        self, obj: DefiLlama, owner: Any = None
+    ) -> Callable[P, Coroutine[Any, Any, R_co]]: ...
+
+
+class _Endpoint(Protocol[P, R_co]):
+    """A method built by `_endpoint`: the builder's arguments, returning the parsed body"""
+
+    @property
+    def aio(self) -> _AsyncEndpoint[P, R_co]: ...
+    @overload
+    def __get__(
+        self, obj: None, owner: Any = None
+    ) -> Callable[Concatenate[DefiLlama, P], R_co]: ...
+    @overload
+    def __get__(self, obj: DefiLlama, owner: Any = None) -> Callable[P, R_co]: ...
+
+
+def _async_doc(doc: Optional[str]) -> Optional[str]:
+    # Mark the summary line of a sync docstring as the async variant's
+    if not doc:
+        return doc
+    lines = doc.split("\n")
+    for i, line in enumerate(lines):
+        if line.strip():
+            summary = line.rstrip()
+            if summary.endswith("."):
+                lines[i] = f"{summary[:-1]} (async)."
+            else:
+                lines[i] = f"{summary} (async)"
+            break
+    return "\n".join(lines)
+
+
+def _endpoint(
+    model: Any, ttl: Optional[float] = None, unwrap: Optional[str] = None
+) -> Callable[[Callable[Concatenate[DefiLlama, P], _Call[R]]], _Endpoint[P, R]]:
+    """
+    Build an endpoint method and its async twin from a single request builder.
+
+    The decorated function maps the method's arguments to a `_Call[R]`. The returned
+    sync method sends it through `_request` and parses the body with `model` into `R`;
+    the async twin, exposed as `.aio` for the class to bind as `<name>_async`, does the
+    same through `_async_request`.
+
+    Args:
+        model: TypeAdapter or `float` the response body is parsed into
+        ttl: Seconds responses stay cached (math.inf for immutable data); defaults to
+            the `_CACHE_TTLS` match for the request path
+        unwrap: Field holding the payload when `model` is an envelope adapter
+    """
+
+    def decorator(
+        build: Callable[Concatenate[DefiLlama, P], _Call[R]],
+    ) -> _Endpoint[P, R]:
+        def method(self: DefiLlama, *args: P.args, **kwargs: P.kwargs) -> R:
+            call = build(self, *args, **kwargs)
+            content = self._request(
+                call.host,
+                "GET",
+                call.path,
+                params=call.params,
+                ttl=ttl if call.ttl is None else call.ttl,
+            )
+            return self._parse_response(model, content, unwrap)
+
+        async def method_async(self: DefiLlama, *args: P.args, **kwargs: P.kwargs) -> R:
+            call = build(self, *args, **kwargs)
+            content = await self._async_request(
+                call.host,
+                "GET",
+                call.path,
+                params=call.params,
+                ttl=ttl if call.ttl is None else call.ttl,
+            )
+            return self._parse_response(model, content, unwrap)
+
+        # Both methods advertise the builder's signature, returning the `R` of its
+        # `_Call[R]` annotation (a string, as annotations are postponed)
+        functools.update_wrapper(method, build)
+        functools.update_wrapper(method_async, build)
+        annotations = dict(getattr(build, "__annotations__", {}))
+        returns = annotations.get("return")
+        if isinstance(returns, str) and returns.startswith("_Call["):
+            annotations["return"] = returns[len("_Call[") : -1]
+        signature = inspect.signature(build).replace(
+            return_annotation=annotations.get("return", inspect.Signature.empty)
+        )
+        name = getattr(build, "__name__", "endpoint")
+        qualname = getattr(build, "__qualname__", name)
+        for func in (method, method_async):
+            setattr(func, "__signature__", signature)
+            func.__annotations__ = dict(annotations)
+        method_async.__name__ = f"{name}_async"
+        method_async.__qualname__ = f"{qualname}_async"
+        method_async.__doc__ = _async_doc(build.__doc__)
+        setattr(method, "aio", method_async)
+        return cast("_Endpoint[P, R]", method)
+
+    return decorator
 
 
 class DefiLlama:
@@ -14,6 +267,7 @@ class DefiLlama:
     token prices, stablecoins, yields, DEX volumes, and fees/revenue data.
 
     The client supports both synchronous and asynchronous operations for all API endpoints.
+    The async methods are built on anyio and run under asyncio or trio.
 
     Base URLs:
     - Main API: https://api.llama.fi
@@ -22,33 +276,653 @@ class DefiLlama:
     - Yields API: https://yields.llama.fi
     """
 
-    def __init__(self):
-        self.client = httpx.Client()
-        self.async_client = httpx.AsyncClient()
-        self.BASE_URL = "https://api.llama.fi"
-        self.COINS_URL = "https://coins.llama.fi"
-        self.STABLECOINS_URL = "https://stablecoins.llama.fi"
-        self.YIELDS_URL = "https://yields.llama.fi"
+    __slots__ = (
+        "decoder",
+        "http_cache",
+        "max_retries",
+        "_limits",
+        "_timeout",
+        "_transport",
+        "_http_cache_dir",
+        "_clients",
+        "_async_clients",
+        "_clients_lock",
+        "_closed",
+        "_cache",
+        "_disk",
+        "_refreshing",
+        "_inflight",
+        "_inflight_lock",
+        "_async_inflight",
+        "_task_group",
+    )
+
+    BASE_URL: ClassVar[str] = "https://api.llama.fi"
+    COINS_URL: ClassVar[str] = "https://coins.llama.fi"
+    STABLECOINS_URL: ClassVar[str] = "https://stablecoins.llama.fi"
+    YIELDS_URL: ClassVar[str] = "https://yields.llama.fi"
+
+    # Seconds a cached response stays fresh, matched by URL substring in order, for
+    # requests whose endpoint doesn't set its own TTL. Batch historical prices never
+    # change once recorded (see _SETTLED_AGE for recent timestamps).
+    _CACHE_TTLS: Tuple[Tuple[str, float], ...] = (("/batchHistorical", math.inf),)
+    _DEFAULT_CACHE_TTL = 300.0
+    # Lookups at timestamps newer than this many seconds can still change (the latest
+    # block, a price inside searchWidth), so only older ones are cached as immutable
+    _SETTLED_AGE = 86400.0
+    # Volume and fee overview paths, and the query parameters they are called with
+    # by default. The defaults are shared across calls and must not be mutated.
+    _DEXS_PATH: ClassVar[str] = "/overview/dexs"
+    _OPTIONS_PATH: ClassVar[str] = "/overview/options"
+    _FEES_PATH: ClassVar[str] = "/overview/fees"
+    _OVERVIEW_DEFAULT_PARAMS: ClassVar[Dict[str, Any]] = {
+        "excludeTotalDataChart": True,
+        "excludeTotalDataChartBreakdown": True,
+    }
+    _OPTIONS_DEFAULT_PARAMS: ClassVar[Dict[str, Any]] = {
+        **_OVERVIEW_DEFAULT_PARAMS,
+        "dataType": "dailyNotionalVolume",
+    }
+    _FEES_DEFAULT_PARAMS: ClassVar[Dict[str, Any]] = {
+        **_OVERVIEW_DEFAULT_PARAMS,
+        "dataType": "dailyFees",
+    }
+    # Keep the coin list part of price URLs around 2 KB, well under common URL limits
+    _MAX_COINS_URL_LENGTH = 2000
+    # Rate limiting and transient gateway errors are retried with jittered
+    # exponential backoff (or the server's Retry-After), capped at _MAX_BACKOFF.
+    _RETRY_STATUSES: ClassVar[FrozenSet[int]] = frozenset({429, 502, 503, 504})
+    _BACKOFF_BASE = 0.5
+    _MAX_BACKOFF = 30.0
+    # Seconds the on-disk HTTP cache keeps an entry before deleting it
+    _HTTP_CACHE_TTL = 86400.0
+
+    def __init__(
+        self,
+        cache: bool = True,
+        cache_maxsize: int = 4096,
+        decoder: Literal["pydantic", "msgspec"] = "pydantic",
+        http_cache: bool = False,
+        max_retries: int = 5,
+        cache_dir: Union[str, Literal[False], None] = None,
+        transport: Optional[
+            Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+        ] = None,
+    ):
+        """
+        Args:
+            cache (bool): Cache raw responses in memory with per-endpoint TTLs (default: True)
+            cache_maxsize (int): Maximum number of cached responses (default: 4096)
+            decoder (Literal["pydantic", "msgspec"]): Response decoder (default: "pydantic").
+                "msgspec" decodes /protocols, /chart/{coins} and /stablecoincharts into
+                msgspec Structs instead of pydantic models; requires the msgspec extra.
+            http_cache (bool): Revalidate responses with ETag / If-None-Match through an
+                on-disk HTTP cache, so unchanged payloads come back as 304s (default: False).
+                Entries are kept for a day under `cache_dir`/http, or ~/.cache/defillama/http
+                (respecting XDG_CACHE_HOME) when no cache_dir is set. Requires the
+                http-cache extra (hishel).
+            max_retries (int): Times a request is retried after a 429, 502, 503 or 504
+                response before raising (default: 5). Set to 0 to disable.
+            cache_dir (Union[str, Literal[False], None]): Directory for a persistent on-disk
+                cache of immutable responses (historical prices, first prices, batch historical
+                prices and block lookups), shared across processes and runs. Defaults to the
+                DEFILLAMA_CACHE_DIR environment variable; disabled if neither is set, or always
+                with cache_dir=False. Requires the disk-cache extra.
+            transport (Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]]): Transport
+                used instead of the pooled HTTP/2 one for every API host, e.g. an
+                httpx.MockTransport in tests. A sync transport only replaces the sync clients'
+                and an async one only the async clients'; httpx.MockTransport is both.
+        """
+        if decoder == "msgspec" and models.msgspec is None:
+            raise ImportError(
+                'decoder="msgspec" requires msgspec: pip install "defillama[msgspec]"'
+            )
+        if http_cache and hishel is None:
+            raise ImportError(
+                'http_cache=True requires hishel: pip install "defillama[http-cache]"'
+            )
+        if cache_dir is None:
+            cache_dir = os.environ.get("DEFILLAMA_CACHE_DIR")
+        if cache_dir and diskcache is None:
+            raise ImportError(
+                'cache_dir requires diskcache: pip install "defillama[disk-cache]"'
+            )
+        self.decoder = decoder
+        # hishel would default to ./.cache/hishel under the caller's working directory,
+        # so keep the HTTP cache next to the disk cache or in the user's cache directory
+        self._http_cache_dir: Optional[Path] = None
+        if http_cache:
+            base_dir = cache_dir or os.path.join(
+                os.environ.get("XDG_CACHE_HOME") or "~/.cache", "defillama"
+            )
+            self._http_cache_dir = Path(base_dir).expanduser() / "http"
+        # One pooled HTTP/2 transport per client so repeated calls reuse warm
+        # connections instead of paying DNS + TCP + TLS setup on every request.
+        self._limits = httpx.Limits(
+            max_connections=100, max_keepalive_connections=50, keepalive_expiry=60
+        )
+        # Multi-MB bodies like /pools and /protocols can take longer than 10s to
+        # download on slow links; fail fast only on connecting.
+        self._timeout = httpx.Timeout(30.0, connect=5.0)
+        self._transport = transport
+        self.http_cache = http_cache
+        self.max_retries = max_retries
+        # httpx's base_url is per client, so each API host gets its own client
+        # (and its own connection pool); requests only pass the path. Clients are
+        # created on first use so sync-only callers never build async ones and
+        # vice versa.
+        self._clients: Dict[str, httpx.Client] = {}
+        self._async_clients: Dict[str, httpx.AsyncClient] = {}
+        self._clients_lock = threading.Lock()
+        self._closed = False
+        self._cache = ResponseCache(maxsize=cache_maxsize) if cache else None
+        self._disk = (
+            diskcache.Cache(os.path.expanduser(cache_dir)) if cache_dir else None
+        )
+        self._refreshing: Set[Hashable] = set()
+        self._inflight: Dict[Hashable, concurrent.futures.Future[bytes]] = {}
+        self._inflight_lock = threading.Lock()
+        self._async_inflight: Dict[Hashable, _Flight] = {}
+        # Runs stale-while-revalidate refreshes while the client is used as an
+        # `async with` block; entered and exited by __aenter__/__aexit__
+        self._task_group: Optional[TaskGroup] = None
+
+    def _make_client(self, host: str) -> httpx.Client:
+        transport: httpx.BaseTransport
+        if isinstance(self._transport, httpx.BaseTransport):
+            transport = self._transport
+        else:
+            transport = httpx.HTTPTransport(http2=True, limits=self._limits, retries=2)
+        if self.http_cache:
+            transport = hishel.CacheTransport(
+                transport=transport,
+                storage=hishel.FileStorage(
+                    base_path=self._http_cache_dir, ttl=self._HTTP_CACHE_TTL
+                ),
+                controller=hishel.Controller(
+                    cacheable_methods=["GET"], allow_stale=True
+                ),
+            )
+        return httpx.Client(
+            base_url=host,
+            headers=_DEFAULT_HEADERS,
+            transport=transport,
+            timeout=self._timeout,
+        )
+
+    def _make_async_client(self, host: str) -> httpx.AsyncClient:
+        transport: httpx.AsyncBaseTransport
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            transport = self._transport
+        else:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True, limits=self._limits, retries=2
+            )
+        if self.http_cache:
+            transport = hishel.AsyncCacheTransport(
+                transport=transport,
+                storage=hishel.AsyncFileStorage(
+                    base_path=self._http_cache_dir, ttl=self._HTTP_CACHE_TTL
+                ),
+                controller=hishel.Controller(
+                    cacheable_methods=["GET"], allow_stale=True
+                ),
+            )
+        return httpx.AsyncClient(
+            base_url=host,
+            headers=_DEFAULT_HEADERS,
+            transport=transport,
+            timeout=self._timeout,
+        )
 
-    def _request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None):
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+
+    def _get_client(self, host: str) -> httpx.Client:
+        client = self._clients.get(host)
+        if client is None:
+            with self._clients_lock:
+                self._check_open()
+                client = self._clients.get(host)
+                if client is None:
+                    client = self._clients[host] = self._make_client(host)
+        return client
+
+    def _get_async_client(self, host: str) -> httpx.AsyncClient:
+        client = self._async_clients.get(host)
+        if client is None:
+            with self._clients_lock:
+                self._check_open()
+                client = self._async_clients.get(host)
+                if client is None:
+                    client = self._async_clients[host] = self._make_async_client(host)
+        return client
+
+    @property
+    def client(self) -> httpx.Client:
+        """The synchronous HTTP client for the main API host."""
+        return self._get_client(self.BASE_URL)
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The asynchronous HTTP client for the main API host."""
+        return self._get_async_client(self.BASE_URL)
+
+    @staticmethod
+    def _cache_key(
+        host: str, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Hashable:
+        return (method, host, path, tuple(sorted(params.items())) if params else ())
+
+    def _ttl_for(self, path: str) -> float:
+        for fragment, ttl in self._CACHE_TTLS:
+            if fragment in path:
+                return ttl
+        return self._DEFAULT_CACHE_TTL
+
+    def _ttl_at(self, timestamp: float) -> Optional[float]:
+        # Per-call TTL for a lookup at `timestamp`: the default while the data can still
+        # change, otherwise None to keep the endpoint's own (immutable) TTL
+        if timestamp > time.time() - self._SETTLED_AGE:
+            return self._DEFAULT_CACHE_TTL
+        return None
+
+    @staticmethod
+    def _has_no_coins(content: bytes) -> bool:
+        # Price lookups for coins without data yet come back as an empty map, which
+        # fills in later
+        if len(content) > 64:
+            return False
+        try:
+            return _loads(content) == {"coins": {}}
+        except ValueError:
+            return False
+
+    def _retry_delay(self, res: httpx.Response, attempt: int) -> Optional[float]:
+        # Seconds to wait before retrying `res`, or None if it shouldn't be retried.
+        if res.status_code not in self._RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        retry_after = res.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self._MAX_BACKOFF)
+            except ValueError:
+                pass  # HTTP-date form; fall back to our own backoff
+        backoff = min(self._MAX_BACKOFF, self._BACKOFF_BASE * 2**attempt)
+        return backoff + random.random() * self._BACKOFF_BASE
+
+    def _store(self, key: Hashable, content: bytes, ttl: float) -> None:
+        if ttl == math.inf and self._has_no_coins(content):
+            ttl = self._DEFAULT_CACHE_TTL
+        if self._cache is not None:
+            self._cache.set(key, content, ttl)
+        if self._disk is not None and ttl == math.inf:
+            self._disk.set(key, content)
+
+    def _load(self, key: Hashable, ttl: float) -> Optional[bytes]:
+        # Immutable responses missing from memory may still be on disk from an
+        # earlier run; promote hits back into the in-memory cache.
+        if self._disk is None or ttl != math.inf:
+            return None
+        content = self._disk.get(key)
+        if content is not None and self._cache is not None:
+            self._cache.set(key, content, math.inf)
+        return content
+
+    def _fetch(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        client = self._get_client(host)
+        attempt = 0
         try:
-            res = self.client.request(method=method, url=url, params=params)
+            while True:
+                res = client.request(method=method, url=path, params=params)
+                delay = self._retry_delay(res, attempt)
+                if delay is None:
+                    break
+                time.sleep(delay)
+                attempt += 1
             res.raise_for_status()
-            return res.json()
+            return res.content
         except httpx.HTTPStatusError as e:
             raise ValueError(f"HTTP error: {e}") from e
 
-    async def _async_request(
-        self, method: str, url: str, params: Optional[Dict[str, Any]] = None
-    ):
+    async def _async_fetch(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        client = self._get_async_client(host)
+        attempt = 0
         try:
-            res = await self.async_client.request(method=method, url=url, params=params)
+            while True:
+                res = await client.request(method=method, url=path, params=params)
+                delay = self._retry_delay(res, attempt)
+                if delay is None:
+                    break
+                await anyio.sleep(delay)
+                attempt += 1
             res.raise_for_status()
-            return res.json()
+            return res.content
         except httpx.HTTPStatusError as e:
             raise ValueError(f"HTTP error: {e}") from e
 
-    def get_protocols(self) -> List[models.Protocol]:
+    def _coalesced_fetch(
+        self,
+        key: Hashable,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        ttl: float,
+    ) -> bytes:
+        # Threads asking for the same request while one is in flight wait on its
+        # result instead of sending a duplicate request.
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        try:
+            content = self._fetch(host, method, path, params)
+            self._store(key, content, ttl)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(content)
+            return content
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    async def _async_coalesced_fetch(
+        self,
+        key: Hashable,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        ttl: float,
+    ) -> bytes:
+        # Coroutines asking for the same request while one is in flight wait for its
+        # result instead of sending a duplicate request. If the coroutine sending it is
+        # cancelled the waiters aren't: the first of them to wake up sends it again.
+        flight = self._async_inflight.get(key)
+        while flight is not None:
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            content = flight.content
+            if content is not None:
+                return content
+            flight = self._async_inflight.get(key)
+        flight = self._async_inflight[key] = _Flight()
+        try:
+            content = await self._async_fetch(host, method, path, params)
+            self._store(key, content, ttl)
+        except Exception as e:
+            flight.error = e
+            raise
+        else:
+            flight.content = content
+            return content
+        finally:
+            del self._async_inflight[key]
+            flight.done.set()
+
+    def _request(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> bytes:
+        self._check_open()
+        if method != "GET":
+            return self._fetch(host, method, path, params)
+        if ttl is None:
+            ttl = self._ttl_for(path)
+        key = self._cache_key(host, method, path, params)
+        if self._cache is not None:
+            content, fresh = self._cache.get(key)
+            if content is not None and fresh:
+                return content
+        content = self._load(key, ttl)
+        if content is not None:
+            return content
+        return self._coalesced_fetch(key, host, method, path, params, ttl)
+
+    async def _async_request(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> bytes:
+        self._check_open()
+        if method != "GET":
+            return await self._async_fetch(host, method, path, params)
+        if ttl is None:
+            ttl = self._ttl_for(path)
+        key = self._cache_key(host, method, path, params)
+        if self._cache is not None:
+            content, fresh = self._cache.get(key)
+            if content is not None and fresh:
+                return content
+            if content is not None and self._task_group is not None:
+                # Serve the stale body now and revalidate in the background
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._task_group.start_soon(
+                        self._refresh, key, host, method, path, params, ttl
+                    )
+                return content
+        content = self._load(key, ttl)
+        if content is not None:
+            return content
+        return await self._async_coalesced_fetch(key, host, method, path, params, ttl)
+
+    async def _refresh(
+        self,
+        key: Hashable,
+        host: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        ttl: float,
+    ) -> None:
+        try:
+            await self._async_coalesced_fetch(key, host, method, path, params, ttl)
+        except Exception:
+            # Keep serving the stale copy; the next call past the stale window refetches.
+            # Nothing may escape into the task group, which would cancel the caller's block.
+            pass
+        finally:
+            self._refreshing.discard(key)
+
+    def _stream_items(
+        self,
+        host: str,
+        path: str,
+        prefix: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        # Feed the body to ijson chunk by chunk and yield each object found under
+        # `prefix` as soon as it is complete. Streams bypass the response cache.
+        if ijson is None:
+            raise ImportError(
+                'Streaming requires ijson: pip install "defillama[streaming]"'
+            )
+        with self._get_client(host).stream("GET", path, params=params) as res:
+            try:
+                res.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise ValueError(f"HTTP error: {e}") from e
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix, use_float=True)
+            for chunk in res.iter_bytes():
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            parser.close()
+            yield from items
+
+    def clear_cache(self) -> None:
+        """
+        Drop every response cached in memory so the next call of each endpoint hits the API.
+
+        The on-disk cache (see `cache_dir`) is left untouched; delete its directory to reset it.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    @staticmethod
+    async def _gather_bounded(
+        func: Callable[..., Awaitable[T]],
+        args_list: Iterable[Tuple[Any, ...]],
+        concurrency: int,
+        fail_fast: bool = False,
+    ) -> List[Union[T, BaseException]]:
+        # Fan out one call per argument tuple in a task group, keeping at most
+        # `concurrency` in flight. Results come back in input order, with exceptions
+        # returned rather than raised; cancellation still propagates to every call.
+        # With `fail_fast` the first failure cancels the calls still pending.
+        args_list = list(args_list)
+        results: List[Any] = [None] * len(args_list)
+        limiter = anyio.CapacityLimiter(concurrency)
+
+        async with anyio.create_task_group() as tg:
+
+            async def run(index: int, args: Tuple[Any, ...]) -> None:
+                async with limiter:
+                    try:
+                        results[index] = await func(*args)
+                    except Exception as e:
+                        results[index] = e
+                        if fail_fast:
+                            tg.cancel_scope.cancel()
+
+            for index, args in enumerate(args_list):
+                tg.start_soon(run, index, args)
+        return results
+
+    @classmethod
+    def _batch_coins(
+        cls,
+        coins: Sequence[str],
+        batch_size: int,
+        cost: Callable[[str], int] = lambda coin: len(coin) + 1,
+    ) -> List[List[str]]:
+        # Split coins into batches of at most `batch_size` whose combined URL cost
+        # stays under _MAX_COINS_URL_LENGTH, so no request trips URL length limits.
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        length = 0
+        for coin in coins:
+            coin_cost = cost(coin)
+            if batch and (
+                len(batch) >= batch_size
+                or length + coin_cost > cls._MAX_COINS_URL_LENGTH
+            ):
+                batches.append(batch)
+                batch, length = [], 0
+            batch.append(coin)
+            length += coin_cost
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _gather_batches(
+        self,
+        func: Callable[..., Awaitable[T]],
+        args_list: Iterable[Tuple[Any, ...]],
+        concurrency: int,
+    ) -> List[T]:
+        # Unlike the per-item bulk helpers a partial merge would be misleading,
+        # so the first failed batch is raised.
+        results = await self._gather_bounded(
+            func, args_list, concurrency, fail_fast=True
+        )
+        values: List[T] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            values.append(result)
+        return values
+
+    @staticmethod
+    def _merge_coin_prices(results: Iterable[models.CoinPrice]) -> models.CoinPrice:
+        merged: Dict[str, models.Coin] = {}
+        for result in results:
+            merged.update(result.coins)
+        return models.CoinPrice(coins=merged)
+
+    @staticmethod
+    def _parse_float(content: bytes) -> float:
+        # Scalar endpoints return a bare JSON number, which float() reads directly
+        # without going through a JSON parser. float() is laxer than JSON ("nan",
+        # "1_0"), so anything it takes that JSON wouldn't goes through the parser.
+        try:
+            result = float(content)
+        except ValueError:
+            result = math.nan
+        if b"_" in content or not math.isfinite(result):
+            value = _loads(content)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Expected a number, got {content[:100]!r}")
+            result = float(value)
+            if not math.isfinite(result):
+                raise ValueError(f"Expected a finite number, got {content[:100]!r}")
+        return result
+
+    @staticmethod
+    def _overview_params(defaults: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        # Hand back the shared defaults when nothing is overridden, so the common
+        # call builds no new dict
+        if all(defaults[name] == value for name, value in params.items()):
+            return defaults
+        return {**defaults, **params}
+
+    def _parse_response(
+        self, adapter: Any, content: bytes, unwrap: Optional[str] = None
+    ) -> Any:
+        result = self._parse(adapter, content)
+        if unwrap is None or isinstance(result, list):
+            return result
+        # Envelope adapters validate the wrapper and its list in one pass and yield
+        # either the wrapper model or, if the API sent a bare list, the list itself.
+        return getattr(result, unwrap)
+
+    def _parse(
+        self,
+        adapter: Union[TypeAdapter[Any], Type[float]],
+        content: bytes,
+    ) -> Any:
+        if isinstance(adapter, type):
+            return self._parse_float(content)
+        if self.decoder == "msgspec":
+            decoder = models.MSGSPEC_DECODERS.get(adapter)
+            if decoder is not None:
+                return decoder.decode(content)
+        # Validate straight from the raw response bytes so pydantic-core parses
+        # and validates in a single pass, without an intermediate dict tree.
+        return adapter.validate_json(content)
+
+    @_endpoint(models.Protocols)
+    def get_protocols(self) -> _Call[List[models.Protocol]]:
         """
         List all protocols on DefiLlama along with their TVL.
 
@@ -57,22 +931,28 @@ class DefiLlama:
 
         API Endpoint: GET /protocols
         """
-        data = self._request("GET", f"{self.BASE_URL}/protocols")
-        return models.Protocols.validate_python(data)
+        return _Call(self.BASE_URL, "/protocols")
+
+    get_protocols_async = get_protocols.aio
 
-    async def get_protocols_async(self) -> List[models.Protocol]:
+    def iter_protocols(self) -> Iterator[models.Protocol]:
         """
-        List all protocols on DefiLlama along with their TVL (async).
+        Stream all protocols on DefiLlama one at a time.
 
-        Returns:
-            List[models.Protocol]: List of all protocols with their current TVL data
+        The response is parsed incrementally as it downloads, so memory stays flat no
+        matter how large the payload is. Breaking out of the loop early stops the download.
+        Requires the streaming extra (ijson).
+
+        Yields:
+            models.Protocol: Protocols with their current TVL data
 
         API Endpoint: GET /protocols
         """
-        data = await self._async_request("GET", f"{self.BASE_URL}/protocols")
-        return models.Protocols.validate_python(data)
+        for item in self._stream_items(self.BASE_URL, "/protocols", "item"):
+            yield models.Protocol.model_validate(item)
 
-    def get_protocol(self, protocol_slug: str) -> models.ProtocolDetails:
+    @_endpoint(models.ProtocolDetailsAdapter)
+    def get_protocol(self, protocol_slug: str) -> _Call[models.ProtocolDetails]:
         """
         Get historical TVL of a protocol and breakdowns by token and chain.
 
@@ -84,29 +964,39 @@ class DefiLlama:
 
         API Endpoint: GET /protocol/{protocol}
         """
-        data = self._request("GET", f"{self.BASE_URL}/protocol/{protocol_slug}")
-        return models.ProtocolDetails.model_validate(data)
+        return _Call(self.BASE_URL, f"/protocol/{protocol_slug}")
+
+    get_protocol_async = get_protocol.aio
 
-    async def get_protocol_async(self, protocol_slug: str) -> models.ProtocolDetails:
+    async def get_protocols_bulk_async(
+        self, protocol_slugs: Sequence[str], concurrency: int = 20
+    ) -> List[Union[models.ProtocolDetails, BaseException]]:
         """
-        Get historical TVL of a protocol and breakdowns by token and chain (async).
+        Get details for many protocols concurrently (async).
+
+        Requests are issued over the client's pooled HTTP/2 connections, with at most
+        `concurrency` in flight at once.
 
         Args:
-            protocol_slug (str): Protocol slug (e.g., "aave", "uniswap")
+            protocol_slugs (Sequence[str]): Protocol slugs (e.g., ["aave", "uniswap"])
+            concurrency (int): Maximum number of requests in flight at once (default: 20)
 
         Returns:
-            models.ProtocolDetails: Detailed protocol information including historical TVL data
+            List[Union[models.ProtocolDetails, BaseException]]: Protocol details in the same order as
+                                                               `protocol_slugs`; failed lookups hold the raised exception
 
         API Endpoint: GET /protocol/{protocol}
         """
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}/protocol/{protocol_slug}"
+        return await self._gather_bounded(
+            self.get_protocol_async,
+            [(slug,) for slug in protocol_slugs],
+            concurrency,
         )
-        return models.ProtocolDetails.model_validate(data)
 
+    @_endpoint(models.HistoricalTvls)
     def get_historical_chain_tvl(
         self, chain_slug: Optional[str] = None
-    ) -> List[models.HistoricalTvl]:
+    ) -> _Call[List[models.HistoricalTvl]]:
         """
         Get historical TVL (excludes liquid staking and double counted TVL) of DeFi on all chains or a specific chain.
 
@@ -119,32 +1009,14 @@ class DefiLlama:
         API Endpoint: GET /v2/historicalChainTvl or GET /v2/historicalChainTvl/{chain}
         """
         endpoint = "/v2/historicalChainTvl"
-        if chain_slug:
+        if chain_slug is not None:
             endpoint = f"{endpoint}/{chain_slug}"
-        data = self._request("GET", f"{self.BASE_URL}{endpoint}")
-        return models.HistoricalTvls.validate_python(data)
+        return _Call(self.BASE_URL, endpoint)
 
-    async def get_historical_chain_tvl_async(
-        self, chain_slug: Optional[str] = None
-    ) -> List[models.HistoricalTvl]:
-        """
-        Get historical TVL (excludes liquid staking and double counted TVL) of DeFi on all chains or a specific chain (async).
+    get_historical_chain_tvl_async = get_historical_chain_tvl.aio
 
-        Args:
-            chain_slug (Optional[str]): Chain slug (e.g., "Ethereum", "BSC"). If None, returns data for all chains.
-
-        Returns:
-            List[models.HistoricalTvl]: Historical TVL data points
-
-        API Endpoint: GET /v2/historicalChainTvl or GET /v2/historicalChainTvl/{chain}
-        """
-        endpoint = "/v2/historicalChainTvl"
-        if chain_slug:
-            endpoint = f"{endpoint}/{chain_slug}"
-        data = await self._async_request("GET", f"{self.BASE_URL}{endpoint}")
-        return models.HistoricalTvls.validate_python(data)
-
-    def get_protocol_tvl(self, protocol_slug: str) -> float:
+    @_endpoint(float)
+    def get_protocol_tvl(self, protocol_slug: str) -> _Call[float]:
         """
         Get simplified current TVL of a protocol.
 
@@ -156,23 +1028,34 @@ class DefiLlama:
 
         API Endpoint: GET /tvl/{protocol}
         """
-        return self._request("GET", f"{self.BASE_URL}/tvl/{protocol_slug}")
+        return _Call(self.BASE_URL, f"/tvl/{protocol_slug}")
+
+    get_protocol_tvl_async = get_protocol_tvl.aio
 
-    async def get_protocol_tvl_async(self, protocol_slug: str) -> float:
+    async def get_protocol_tvls_bulk_async(
+        self, protocol_slugs: Sequence[str], concurrency: int = 20
+    ) -> List[Union[float, BaseException]]:
         """
-        Get simplified current TVL of a protocol (async).
+        Get simplified current TVL of many protocols concurrently (async).
 
         Args:
-            protocol_slug (str): Protocol slug (e.g., "uniswap", "aave")
+            protocol_slugs (Sequence[str]): Protocol slugs (e.g., ["uniswap", "aave"])
+            concurrency (int): Maximum number of requests in flight at once (default: 20)
 
         Returns:
-            float: Current TVL value as a number
+            List[Union[float, BaseException]]: TVL values in the same order as `protocol_slugs`;
+                                               failed lookups hold the raised exception
 
         API Endpoint: GET /tvl/{protocol}
         """
-        return await self._async_request("GET", f"{self.BASE_URL}/tvl/{protocol_slug}")
+        return await self._gather_bounded(
+            self.get_protocol_tvl_async,
+            [(slug,) for slug in protocol_slugs],
+            concurrency,
+        )
 
-    def get_chains(self) -> List[models.Chain]:
+    @_endpoint(models.Chains)
+    def get_chains(self) -> _Call[List[models.Chain]]:
         """
         Get current TVL of all chains.
 
@@ -181,24 +1064,14 @@ class DefiLlama:
 
         API Endpoint: GET /v2/chains
         """
-        data = self._request("GET", f"{self.BASE_URL}/v2/chains")
-        return models.Chains.validate_python(data)
-
-    async def get_chains_async(self) -> List[models.Chain]:
-        """
-        Get current TVL of all chains (async).
+        return _Call(self.BASE_URL, "/v2/chains")
 
-        Returns:
-            List[models.Chain]: List of all chains with their current TVL data
-
-        API Endpoint: GET /v2/chains
-        """
-        data = await self._async_request("GET", f"{self.BASE_URL}/v2/chains")
-        return models.Chains.validate_python(data)
+    get_chains_async = get_chains.aio
 
+    @_endpoint(models.CoinPriceAdapter, ttl=30.0)
     def get_current_prices(
         self, coins: List[str], search_width: str = "4h"
-    ) -> models.CoinPrice:
+    ) -> _Call[models.CoinPrice]:
         """
         Get current prices of tokens by contract address.
 
@@ -217,40 +1090,45 @@ class DefiLlama:
         """
         coins_str = ",".join(coins)
         params = {"searchWidth": search_width}
-        data = self._request(
-            "GET", f"{self.COINS_URL}/prices/current/{coins_str}", params=params
-        )
-        return models.CoinPrice.model_validate(data)
+        return _Call(self.COINS_URL, f"/prices/current/{coins_str}", params)
 
-    async def get_current_prices_async(
-        self, coins: List[str], search_width: str = "4h"
+    get_current_prices_async = get_current_prices.aio
+
+    async def get_current_prices_bulk_async(
+        self,
+        coins: Sequence[str],
+        search_width: str = "4h",
+        batch_size: int = 100,
+        concurrency: int = 8,
     ) -> models.CoinPrice:
         """
-        Get current prices of tokens by contract address (async).
+        Get current prices of any number of tokens (async).
 
-        The API prices tokens through multiple methods including bridged token pricing,
-        specialized adapters for LP tokens, and liquidity-based pricing for exotic tokens.
+        The coins are split into URL-length-safe batches that are fetched concurrently
+        and merged into a single response.
 
         Args:
-            coins (List[str]): List of tokens in format {chain}:{address} or coingecko:{id}
-                              Examples: ["ethereum:0xdF574c24545E5FfEcb9a659c229253D4111d87e1", "coingecko:ethereum"]
+            coins (Sequence[str]): Tokens in format {chain}:{address} or coingecko:{id}
             search_width (str): Time range on either side to find price data (default: "4h")
+            batch_size (int): Maximum number of coins per request (default: 100)
+            concurrency (int): Maximum number of requests in flight at once (default: 8)
 
         Returns:
-            models.CoinPrice: Current price data for the requested tokens
+            models.CoinPrice: Current price data for all requested tokens
 
         API Endpoint: GET /prices/current/{coins}
         """
-        coins_str = ",".join(coins)
-        params = {"searchWidth": search_width}
-        data = await self._async_request(
-            "GET", f"{self.COINS_URL}/prices/current/{coins_str}", params=params
+        results = await self._gather_batches(
+            self.get_current_prices_async,
+            [(batch, search_width) for batch in self._batch_coins(coins, batch_size)],
+            concurrency,
         )
-        return models.CoinPrice.model_validate(data)
+        return self._merge_coin_prices(results)
 
+    @_endpoint(models.CoinPriceAdapter, ttl=math.inf)
     def get_historical_prices(
         self, timestamp: int, coins: List[str], search_width: str = "4h"
-    ) -> models.CoinPrice:
+    ) -> _Call[models.CoinPrice]:
         """
         Get historical prices of tokens by contract address at a specific timestamp.
 
@@ -267,38 +1145,14 @@ class DefiLlama:
         """
         coins_str = ",".join(coins)
         params = {"searchWidth": search_width}
-        data = self._request(
-            "GET",
-            f"{self.COINS_URL}/prices/historical/{timestamp}/{coins_str}",
-            params=params,
+        return _Call(
+            self.COINS_URL,
+            f"/prices/historical/{timestamp}/{coins_str}",
+            params,
+            ttl=self._ttl_at(timestamp),
         )
-        return models.CoinPrice.model_validate(data)
-
-    async def get_historical_prices_async(
-        self, timestamp: int, coins: List[str], search_width: str = "4h"
-    ) -> models.CoinPrice:
-        """
-        Get historical prices of tokens by contract address at a specific timestamp (async).
 
-        Args:
-            timestamp (int): UNIX timestamp of time when you want historical prices
-            coins (List[str]): List of tokens in format {chain}:{address} or coingecko:{id}
-                              Examples: ["ethereum:0xdF574c24545E5FfEcb9a659c229253D4111d87e1", "coingecko:ethereum"]
-            search_width (str): Time range on either side to find price data (default: "4h")
-
-        Returns:
-            models.CoinPrice: Historical price data for the requested tokens at the specified timestamp
-
-        API Endpoint: GET /prices/historical/{timestamp}/{coins}
-        """
-        coins_str = ",".join(coins)
-        params = {"searchWidth": search_width}
-        data = await self._async_request(
-            "GET",
-            f"{self.COINS_URL}/prices/historical/{timestamp}/{coins_str}",
-            params=params,
-        )
-        return models.CoinPrice.model_validate(data)
+    get_historical_prices_async = get_historical_prices.aio
 
     def get_batch_historical_prices(
         self, coins: Dict[str, List[int]], search_width: Optional[str] = None
@@ -317,11 +1171,20 @@ class DefiLlama:
 
         API Endpoint: GET /batchHistorical
         """
-        params = {"coins": str(coins)}
-        if search_width:
+        if not coins:
+            return models.BatchHistoricalPrices(coins={})
+        params = {"coins": _dumps(coins)}
+        if search_width is not None:
             params["searchWidth"] = search_width
-        data = self._request("GET", f"{self.COINS_URL}/batchHistorical", params=params)
-        return models.BatchHistoricalPrices.model_validate(data)
+        latest = max((ts for stamps in coins.values() for ts in stamps), default=0)
+        content = self._request(
+            self.COINS_URL,
+            "GET",
+            "/batchHistorical",
+            params=params,
+            ttl=self._ttl_at(latest),
+        )
+        return self._parse(models.BatchHistoricalPricesAdapter, content)
 
     async def get_batch_historical_prices_async(
         self, coins: Dict[str, List[int]], search_width: Optional[str] = None
@@ -340,59 +1203,68 @@ class DefiLlama:
 
         API Endpoint: GET /batchHistorical
         """
-        params = {"coins": str(coins)}
-        if search_width:
+        if not coins:
+            return models.BatchHistoricalPrices(coins={})
+        params = {"coins": _dumps(coins)}
+        if search_width is not None:
             params["searchWidth"] = search_width
-        data = await self._async_request(
-            "GET", f"{self.COINS_URL}/batchHistorical", params=params
+        latest = max((ts for stamps in coins.values() for ts in stamps), default=0)
+        content = await self._async_request(
+            self.COINS_URL,
+            "GET",
+            "/batchHistorical",
+            params=params,
+            ttl=self._ttl_at(latest),
         )
-        return models.BatchHistoricalPrices.model_validate(data)
+        return self._parse(models.BatchHistoricalPricesAdapter, content)
 
-    def get_price_chart(
+    async def get_batch_historical_prices_bulk_async(
         self,
-        coins: List[str],
-        start: Optional[int] = None,
-        end: Optional[int] = None,
-        span: Optional[int] = None,
-        period: Optional[str] = None,
+        coins: Dict[str, List[int]],
         search_width: Optional[str] = None,
-    ) -> models.PriceChart:
+        batch_size: int = 20,
+        concurrency: int = 8,
+    ) -> models.BatchHistoricalPrices:
         """
-        Get token prices at regular time intervals.
+        Get historical prices for any number of tokens at multiple timestamps (async).
+
+        The coins are split into URL-length-safe batches that are fetched concurrently
+        and merged into a single response.
 
         Args:
-            coins (List[str]): List of tokens in format {chain}:{address} or coingecko:{id}
-                              Examples: ["ethereum:0xdF574c24545E5FfEcb9a659c229253D4111d87e1", "coingecko:ethereum"]
-            start (Optional[int]): UNIX timestamp of earliest data point requested
-            end (Optional[int]): UNIX timestamp of latest data point requested
-            span (Optional[int]): Number of data points returned (default: 0)
-            period (Optional[str]): Duration between data points (default: "24h")
-                                  Can use chart candle notation like '4h', '2d', '1w', '1M'
-            search_width (Optional[str]): Time range on either side to find price data (default: 10% of period)
+            coins (Dict[str, List[int]]): Dictionary where keys are coins in format {chain}:{address},
+                                        and values are arrays of requested timestamps
+            search_width (Optional[str]): Time range on either side to find price data (default: 6 hours)
+            batch_size (int): Maximum number of coins per request (default: 20)
+            concurrency (int): Maximum number of requests in flight at once (default: 8)
 
         Returns:
-            models.PriceChart: Chart data with prices at regular intervals
+            models.BatchHistoricalPrices: Historical price data for all requested tokens
 
-        API Endpoint: GET /chart/{coins}
+        API Endpoint: GET /batchHistorical
         """
-        coins_str = ",".join(coins)
-        params = {}
-        if start:
-            params["start"] = start
-        if end:
-            params["end"] = end
-        if span:
-            params["span"] = span
-        if period:
-            params["period"] = period
-        if search_width:
-            params["searchWidth"] = search_width
-        data = self._request(
-            "GET", f"{self.COINS_URL}/chart/{coins_str}", params=params
+        # The coins go out as URL-encoded JSON, so each one costs the percent-encoded
+        # length of its `"coin":[ts,...],` fragment
+        batches = self._batch_coins(
+            list(coins),
+            batch_size,
+            cost=lambda coin: len(quote(f'"{coin}":{_dumps(coins[coin])},', safe="")),
+        )
+        results = await self._gather_batches(
+            self.get_batch_historical_prices_async,
+            [
+                ({coin: coins[coin] for coin in batch}, search_width)
+                for batch in batches
+            ],
+            concurrency,
         )
-        return models.PriceChart.model_validate(data)
+        merged: Dict[str, models.CoinHistoricalData] = {}
+        for result in results:
+            merged.update(result.coins)
+        return models.BatchHistoricalPrices(coins=merged)
 
-    async def get_price_chart_async(
+    @_endpoint(models.PriceChartAdapter)
+    def get_price_chart(
         self,
         coins: List[str],
         start: Optional[int] = None,
@@ -400,9 +1272,9 @@ class DefiLlama:
         span: Optional[int] = None,
         period: Optional[str] = None,
         search_width: Optional[str] = None,
-    ) -> models.PriceChart:
+    ) -> _Call[models.PriceChart]:
         """
-        Get token prices at regular time intervals (async).
+        Get token prices at regular time intervals.
 
         Args:
             coins (List[str]): List of tokens in format {chain}:{address} or coingecko:{id}
@@ -421,28 +1293,28 @@ class DefiLlama:
         """
         coins_str = ",".join(coins)
         params = {}
-        if start:
+        if start is not None:
             params["start"] = start
-        if end:
+        if end is not None:
             params["end"] = end
-        if span:
+        if span is not None:
             params["span"] = span
-        if period:
+        if period is not None:
             params["period"] = period
-        if search_width:
+        if search_width is not None:
             params["searchWidth"] = search_width
-        data = await self._async_request(
-            "GET", f"{self.COINS_URL}/chart/{coins_str}", params=params
-        )
-        return models.PriceChart.model_validate(data)
+        return _Call(self.COINS_URL, f"/chart/{coins_str}", params)
 
+    get_price_chart_async = get_price_chart.aio
+
+    @_endpoint(models.PercentageChangeAdapter)
     def get_price_percentage_change(
         self,
         coins: List[str],
         timestamp: Optional[int] = None,
         look_forward: bool = False,
         period: str = "24h",
-    ) -> models.PercentageChange:
+    ) -> _Call[models.PercentageChange]:
         """
         Get percentage change in price over time.
 
@@ -461,46 +1333,14 @@ class DefiLlama:
         """
         coins_str = ",".join(coins)
         params = {"lookForward": look_forward, "period": period}
-        if timestamp:
+        if timestamp is not None:
             params["timestamp"] = timestamp
-        data = self._request(
-            "GET", f"{self.COINS_URL}/percentage/{coins_str}", params=params
-        )
-        return models.PercentageChange.model_validate(data)
+        return _Call(self.COINS_URL, f"/percentage/{coins_str}", params)
 
-    async def get_price_percentage_change_async(
-        self,
-        coins: List[str],
-        timestamp: Optional[int] = None,
-        look_forward: bool = False,
-        period: str = "24h",
-    ) -> models.PercentageChange:
-        """
-        Get percentage change in price over time (async).
-
-        Args:
-            coins (List[str]): List of tokens in format {chain}:{address} or coingecko:{id}
-                              Examples: ["ethereum:0xdF574c24545E5FfEcb9a659c229253D4111d87e1", "coingecko:ethereum"]
-            timestamp (Optional[int]): Timestamp of data point requested (default: current time)
-            look_forward (bool): Whether to look forward from timestamp or backward (default: False)
-            period (str): Duration for percentage calculation (default: "24h")
-                         Can use chart candle notation like '4h', '2d', '1w', '1M'
-
-        Returns:
-            models.PercentageChange: Percentage change data for the requested tokens
-
-        API Endpoint: GET /percentage/{coins}
-        """
-        coins_str = ",".join(coins)
-        params = {"lookForward": look_forward, "period": period}
-        if timestamp:
-            params["timestamp"] = timestamp
-        data = await self._async_request(
-            "GET", f"{self.COINS_URL}/percentage/{coins_str}", params=params
-        )
-        return models.PercentageChange.model_validate(data)
+    get_price_percentage_change_async = get_price_percentage_change.aio
 
-    def get_first_prices(self, coins: List[str]) -> models.CoinPrice:
+    @_endpoint(models.CoinPriceAdapter, ttl=math.inf)
+    def get_first_prices(self, coins: List[str]) -> _Call[models.CoinPrice]:
         """
         Get earliest timestamp price record for coins.
 
@@ -514,29 +1354,38 @@ class DefiLlama:
         API Endpoint: GET /prices/first/{coins}
         """
         coins_str = ",".join(coins)
-        data = self._request("GET", f"{self.COINS_URL}/prices/first/{coins_str}")
-        return models.CoinPrice.model_validate(data)
+        return _Call(self.COINS_URL, f"/prices/first/{coins_str}")
 
-    async def get_first_prices_async(self, coins: List[str]) -> models.CoinPrice:
+    get_first_prices_async = get_first_prices.aio
+
+    async def get_first_prices_bulk_async(
+        self, coins: Sequence[str], batch_size: int = 100, concurrency: int = 8
+    ) -> models.CoinPrice:
         """
-        Get earliest timestamp price record for coins (async).
+        Get earliest timestamp price records for any number of coins (async).
+
+        The coins are split into URL-length-safe batches that are fetched concurrently
+        and merged into a single response.
 
         Args:
-            coins (List[str]): List of tokens in format {chain}:{address} or coingecko:{id}
-                              Examples: ["ethereum:0xdF574c24545E5FfEcb9a659c229253D4111d87e1", "coingecko:ethereum"]
+            coins (Sequence[str]): Tokens in format {chain}:{address} or coingecko:{id}
+            batch_size (int): Maximum number of coins per request (default: 100)
+            concurrency (int): Maximum number of requests in flight at once (default: 8)
 
         Returns:
-            models.CoinPrice: First available price data for the requested tokens
+            models.CoinPrice: First available price data for all requested tokens
 
         API Endpoint: GET /prices/first/{coins}
         """
-        coins_str = ",".join(coins)
-        data = await self._async_request(
-            "GET", f"{self.COINS_URL}/prices/first/{coins_str}"
+        results = await self._gather_batches(
+            self.get_first_prices_async,
+            [(batch,) for batch in self._batch_coins(coins, batch_size)],
+            concurrency,
         )
-        return models.CoinPrice.model_validate(data)
+        return self._merge_coin_prices(results)
 
-    def get_block(self, chain: str, timestamp: int) -> models.Block:
+    @_endpoint(models.BlockAdapter, ttl=math.inf)
+    def get_block(self, chain: str, timestamp: int) -> _Call[models.Block]:
         """
         Get the closest block to a timestamp.
 
@@ -553,34 +1402,35 @@ class DefiLlama:
 
         API Endpoint: GET /block/{chain}/{timestamp}
         """
-        data = self._request(
-            "GET", f"{self.COINS_URL}/block/{chain.lower()}/{timestamp}"
+        chain = chain.lower()
+        return _Call(
+            self.COINS_URL, f"/block/{chain}/{timestamp}", ttl=self._ttl_at(timestamp)
         )
-        return models.Block.model_validate(data)
 
-    async def get_block_async(self, chain: str, timestamp: int) -> models.Block:
-        """
-        Get the closest block to a timestamp (async).
+    get_block_async = get_block.aio
 
-        Runs binary search over a blockchain's blocks to get the closest one to a timestamp.
-        Every time this is run, new data is added to the database, so each query permanently
-        speeds up future queries.
+    async def get_blocks_bulk_async(
+        self, queries: Sequence[Tuple[str, int]], concurrency: int = 20
+    ) -> List[Union[models.Block, BaseException]]:
+        """
+        Get the closest block to many (chain, timestamp) pairs concurrently (async).
 
         Args:
-            chain (str): Chain which you want to get the block from
-            timestamp (int): UNIX timestamp of the block you are searching for
+            queries (Sequence[Tuple[str, int]]): Pairs of chain name and UNIX timestamp
+            concurrency (int): Maximum number of requests in flight at once (default: 20)
 
         Returns:
-            models.Block: Block information with height and timestamp
+            List[Union[models.Block, BaseException]]: Block information in the same order as `queries`;
+                                                      failed lookups hold the raised exception
 
         API Endpoint: GET /block/{chain}/{timestamp}
         """
-        data = await self._async_request(
-            "GET", f"{self.COINS_URL}/block/{chain}/{timestamp}"
-        )
-        return models.Block.model_validate(data)
+        return await self._gather_bounded(self.get_block_async, queries, concurrency)
 
-    def get_stablecoins(self, include_prices: bool = True) -> List[models.Stablecoin]:
+    @_endpoint(models.StablecoinsEnvelope, unwrap="peggedAssets")
+    def get_stablecoins(
+        self, include_prices: bool = True
+    ) -> _Call[List[models.Stablecoin]]:
         """
         List all stablecoins along with their circulating amounts.
 
@@ -593,40 +1443,14 @@ class DefiLlama:
         API Endpoint: GET /stablecoins
         """
         params = {"includePrices": include_prices}
-        data = self._request(
-            "GET", f"{self.STABLECOINS_URL}/stablecoins", params=params
-        )
-        # The API returns {"peggedAssets": [...]}
-        if isinstance(data, dict) and "peggedAssets" in data:
-            return models.Stablecoins.validate_python(data["peggedAssets"])
-        return models.Stablecoins.validate_python(data)
+        return _Call(self.STABLECOINS_URL, "/stablecoins", params)
 
-    async def get_stablecoins_async(
-        self, include_prices: bool = True
-    ) -> List[models.Stablecoin]:
-        """
-        List all stablecoins along with their circulating amounts (async).
-
-        Args:
-            include_prices (bool): Whether to include current stablecoin prices (default: True)
-
-        Returns:
-            List[models.Stablecoin]: List of all stablecoins with their circulating amounts
-
-        API Endpoint: GET /stablecoins
-        """
-        params = {"includePrices": include_prices}
-        data = await self._async_request(
-            "GET", f"{self.STABLECOINS_URL}/stablecoins", params=params
-        )
-        # The API returns {"peggedAssets": [...]}
-        if isinstance(data, dict) and "peggedAssets" in data:
-            return models.Stablecoins.validate_python(data["peggedAssets"])
-        return models.Stablecoins.validate_python(data)
+    get_stablecoins_async = get_stablecoins.aio
 
+    @_endpoint(models.StablecoinCharts)
     def get_stablecoin_charts(
         self, chain: Optional[str] = None, stablecoin: Optional[int] = None
-    ) -> List[models.StablecoinChart]:
+    ) -> _Call[List[models.StablecoinChart]]:
         """
         Get historical market cap sum of all stablecoins or stablecoins in a specific chain.
 
@@ -640,43 +1464,49 @@ class DefiLlama:
         API Endpoint: GET /stablecoincharts/all or GET /stablecoincharts/{chain}
         """
         endpoint = "/stablecoincharts/all"
-        if chain:
+        if chain is not None:
             endpoint = f"/stablecoincharts/{chain}"
         params = {}
-        if stablecoin:
+        if stablecoin is not None:
             params["stablecoin"] = stablecoin
-        data = self._request("GET", f"{self.STABLECOINS_URL}{endpoint}", params=params)
-        # The API returns a list of chart data points
-        return models.StablecoinCharts.validate_python(data)
+        return _Call(self.STABLECOINS_URL, endpoint, params)
+
+    get_stablecoin_charts_async = get_stablecoin_charts.aio
 
-    async def get_stablecoin_charts_async(
+    def iter_stablecoin_charts(
         self, chain: Optional[str] = None, stablecoin: Optional[int] = None
-    ) -> List[models.StablecoinChart]:
+    ) -> Iterator[models.StablecoinChart]:
         """
-        Get historical market cap sum of all stablecoins or stablecoins in a specific chain (async).
+        Stream historical market cap of stablecoins one data point at a time.
+
+        The response is parsed incrementally as it downloads, so memory stays flat no
+        matter how large the payload is. Breaking out of the loop early stops the download.
+        Requires the streaming extra (ijson).
 
         Args:
             chain (Optional[str]): Chain slug (e.g., "Ethereum"). If None, returns data for all chains.
             stablecoin (Optional[int]): Stablecoin ID from /stablecoins endpoint. If None, returns data for all stablecoins.
 
-        Returns:
-            List[models.StablecoinChart]: Historical market cap data for stablecoins
+        Yields:
+            models.StablecoinChart: Historical market cap data points
 
         API Endpoint: GET /stablecoincharts/all or GET /stablecoincharts/{chain}
         """
         endpoint = "/stablecoincharts/all"
-        if chain:
+        if chain is not None:
             endpoint = f"/stablecoincharts/{chain}"
         params = {}
-        if stablecoin:
+        if stablecoin is not None:
             params["stablecoin"] = stablecoin
-        data = await self._async_request(
-            "GET", f"{self.STABLECOINS_URL}{endpoint}", params=params
-        )
-        # The API returns a list of chart data points
-        return models.StablecoinCharts.validate_python(data)
+        for item in self._stream_items(
+            self.STABLECOINS_URL, endpoint, "item", params=params
+        ):
+            yield models.StablecoinChart.model_validate(item)
 
-    def get_stablecoin_historical(self, asset_id: int) -> models.StablecoinHistorical:
+    @_endpoint(models.StablecoinHistoricalAdapter)
+    def get_stablecoin_historical(
+        self, asset_id: int
+    ) -> _Call[models.StablecoinHistorical]:
         """
         Get historical market cap and historical chain distribution of a stablecoin.
 
@@ -688,29 +1518,12 @@ class DefiLlama:
 
         API Endpoint: GET /stablecoin/{asset}
         """
-        data = self._request("GET", f"{self.STABLECOINS_URL}/stablecoin/{asset_id}")
-        return models.StablecoinHistorical.model_validate(data)
+        return _Call(self.STABLECOINS_URL, f"/stablecoin/{asset_id}")
 
-    async def get_stablecoin_historical_async(
-        self, asset_id: int
-    ) -> models.StablecoinHistorical:
-        """
-        Get historical market cap and historical chain distribution of a stablecoin (async).
+    get_stablecoin_historical_async = get_stablecoin_historical.aio
 
-        Args:
-            asset_id (int): Stablecoin ID from /stablecoins endpoint
-
-        Returns:
-            models.StablecoinHistorical: Historical data for the specified stablecoin
-
-        API Endpoint: GET /stablecoin/{asset}
-        """
-        data = await self._async_request(
-            "GET", f"{self.STABLECOINS_URL}/stablecoin/{asset_id}"
-        )
-        return models.StablecoinHistorical.model_validate(data)
-
-    def get_stablecoin_chains(self) -> List[models.StablecoinChainData]:
+    @_endpoint(models.StablecoinChains)
+    def get_stablecoin_chains(self) -> _Call[List[models.StablecoinChainData]]:
         """
         Get current market cap sum of all stablecoins on each chain.
 
@@ -719,26 +1532,12 @@ class DefiLlama:
 
         API Endpoint: GET /stablecoinchains
         """
-        data = self._request("GET", f"{self.STABLECOINS_URL}/stablecoinchains")
-        # The API returns a list of chain data
-        return models.StablecoinChains.validate_python(data)
+        return _Call(self.STABLECOINS_URL, "/stablecoinchains")
 
-    async def get_stablecoin_chains_async(self) -> List[models.StablecoinChainData]:
-        """
-        Get current market cap sum of all stablecoins on each chain (async).
+    get_stablecoin_chains_async = get_stablecoin_chains.aio
 
-        Returns:
-            List[models.StablecoinChainData]: Market cap data for stablecoins on each chain
-
-        API Endpoint: GET /stablecoinchains
-        """
-        data = await self._async_request(
-            "GET", f"{self.STABLECOINS_URL}/stablecoinchains"
-        )
-        # The API returns a list of chain data
-        return models.StablecoinChains.validate_python(data)
-
-    def get_stablecoin_prices(self) -> List[models.StablecoinPrice]:
+    @_endpoint(models.StablecoinPrices)
+    def get_stablecoin_prices(self) -> _Call[List[models.StablecoinPrice]]:
         """
         Get historical prices of all stablecoins.
 
@@ -747,26 +1546,12 @@ class DefiLlama:
 
         API Endpoint: GET /stablecoinprices
         """
-        data = self._request("GET", f"{self.STABLECOINS_URL}/stablecoinprices")
-        # The API returns a list of price data
-        return models.StablecoinPrices.validate_python(data)
-
-    async def get_stablecoin_prices_async(self) -> List[models.StablecoinPrice]:
-        """
-        Get historical prices of all stablecoins (async).
-
-        Returns:
-            List[models.StablecoinPrice]: Historical price data for all stablecoins
+        return _Call(self.STABLECOINS_URL, "/stablecoinprices")
 
-        API Endpoint: GET /stablecoinprices
-        """
-        data = await self._async_request(
-            "GET", f"{self.STABLECOINS_URL}/stablecoinprices"
-        )
-        # The API returns a list of price data
-        return models.StablecoinPrices.validate_python(data)
+    get_stablecoin_prices_async = get_stablecoin_prices.aio
 
-    def get_pools(self) -> List[models.Pool]:
+    @_endpoint(models.PoolsEnvelope, unwrap="data")
+    def get_pools(self) -> _Call[List[models.Pool]]:
         """
         Retrieve the latest data for all pools, including enriched information such as predictions.
 
@@ -775,28 +1560,29 @@ class DefiLlama:
 
         API Endpoint: GET /pools
         """
-        data = self._request("GET", f"{self.YIELDS_URL}/pools")
-        # The API returns {"data": [...], "status": "success"}
-        if isinstance(data, dict) and "data" in data:
-            return models.Pools.validate_python(data["data"])
-        return models.Pools.validate_python(data)
+        return _Call(self.YIELDS_URL, "/pools")
+
+    get_pools_async = get_pools.aio
 
-    async def get_pools_async(self) -> List[models.Pool]:
+    def iter_pools(self) -> Iterator[models.Pool]:
         """
-        Retrieve the latest data for all pools, including enriched information such as predictions (async).
+        Stream the latest data for all pools one at a time.
 
-        Returns:
-            List[models.Pool]: List of all yield farming pools with their current data
+        The response is parsed incrementally as it downloads, so memory stays flat no
+        matter how large the payload is. Breaking out of the loop early stops the download.
+        Requires the streaming extra (ijson).
+
+        Yields:
+            models.Pool: Yield farming pools with their current data
 
         API Endpoint: GET /pools
         """
-        data = await self._async_request("GET", f"{self.YIELDS_URL}/pools")
-        # The API returns {"data": [...], "status": "success"}
-        if isinstance(data, dict) and "data" in data:
-            return models.Pools.validate_python(data["data"])
-        return models.Pools.validate_python(data)
+        # The pools are under "data" in {"status": "success", "data": [...]}
+        for item in self._stream_items(self.YIELDS_URL, "/pools", "data.item"):
+            yield models.Pool.model_validate(item)
 
-    def get_pool_chart(self, pool_id: str) -> List[models.PoolChart]:
+    @_endpoint(models.PoolChartsEnvelope, unwrap="data")
+    def get_pool_chart(self, pool_id: str) -> _Call[List[models.PoolChart]]:
         """
         Get historical APY and TVL of a pool.
 
@@ -808,31 +1594,40 @@ class DefiLlama:
 
         API Endpoint: GET /chart/{pool}
         """
-        data = self._request("GET", f"{self.YIELDS_URL}/chart/{pool_id}")
-        return models.PoolCharts.validate_python(data)
+        return _Call(self.YIELDS_URL, f"/chart/{pool_id}")
+
+    get_pool_chart_async = get_pool_chart.aio
 
-    async def get_pool_chart_async(self, pool_id: str) -> List[models.PoolChart]:
+    async def get_pool_charts_bulk_async(
+        self, pool_ids: Sequence[str], concurrency: int = 20
+    ) -> List[Union[List[models.PoolChart], BaseException]]:
         """
-        Get historical APY and TVL of a pool (async).
+        Get historical APY and TVL of many pools concurrently (async).
 
         Args:
-            pool_id (str): Pool ID, can be retrieved from /pools (property is called pool)
+            pool_ids (Sequence[str]): Pool IDs, can be retrieved from /pools (property is called pool)
+            concurrency (int): Maximum number of requests in flight at once (default: 20)
 
         Returns:
-            List[models.PoolChart]: Historical APY and TVL data for the specified pool
+            List[Union[List[models.PoolChart], BaseException]]: Chart data in the same order as `pool_ids`;
+                                                                failed lookups hold the raised exception
 
         API Endpoint: GET /chart/{pool}
         """
-        data = await self._async_request("GET", f"{self.YIELDS_URL}/chart/{pool_id}")
-        return models.PoolCharts.validate_python(data)
+        return await self._gather_bounded(
+            self.get_pool_chart_async,
+            [(pool_id,) for pool_id in pool_ids],
+            concurrency,
+        )
 
     # TODO: fix this. it's not returning all the data.
+    @_endpoint(models.DexOverviewAdapter)
     def get_dexs(
         self,
         chain: Optional[str] = None,
         exclude_total_data_chart: bool = True,
         exclude_total_data_chart_breakdown: bool = True,
-    ) -> models.DexOverview:
+    ) -> _Call[models.DexOverview]:
         """
         List all DEXs along with summaries of their volumes and dataType history data.
 
@@ -847,58 +1642,24 @@ class DefiLlama:
 
         API Endpoint: GET /overview/dexs or GET /overview/dexs/{chain}
         """
-        endpoint = "/overview/dexs"
-        if chain:
-            endpoint = f"{endpoint}/{chain}"
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-        }
-        data = self._request("GET", f"{self.BASE_URL}{endpoint}", params=params)
-        # The API returns a summary object, not a list
-        return models.DexOverview.model_validate(data)
-
-    # TODO: fix this. it's not returning all the data.
-    async def get_dexs_async(
-        self,
-        chain: Optional[str] = None,
-        exclude_total_data_chart: bool = True,
-        exclude_total_data_chart_breakdown: bool = True,
-    ) -> models.DexOverview:
-        """
-        List all DEXs along with summaries of their volumes and dataType history data (async).
-
-        Args:
-            chain (Optional[str]): Chain name to filter by. List of supported chains can be found
-                                  under allChains attribute in /overview/dexs response.
-            exclude_total_data_chart (bool): True to exclude aggregated chart from response (default: True)
-            exclude_total_data_chart_breakdown (bool): True to exclude broken down chart from response (default: True)
-
-        Returns:
-            models.DexOverview: Overview of all DEXs with their volume data
-
-        API Endpoint: GET /overview/dexs or GET /overview/dexs/{chain}
-        """
-        endpoint = "/overview/dexs"
-        if chain:
-            endpoint = f"{endpoint}/{chain}"
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-        }
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}{endpoint}", params=params
+        endpoint = f"{self._DEXS_PATH}/{chain}" if chain else self._DEXS_PATH
+        params = self._overview_params(
+            self._OVERVIEW_DEFAULT_PARAMS,
+            excludeTotalDataChart=exclude_total_data_chart,
+            excludeTotalDataChartBreakdown=exclude_total_data_chart_breakdown,
         )
-        # The API returns a summary object, not a list
-        return models.DexOverview.model_validate(data)
+        return _Call(self.BASE_URL, endpoint, params)
+
+    get_dexs_async = get_dexs.aio
 
     # TODO: fix this. it's failing to validate the data.
+    @_endpoint(models.DexAdapter)
     def get_dex_summary(
         self,
         protocol_slug: str,
         exclude_total_data_chart: bool = True,
         exclude_total_data_chart_breakdown: bool = True,
-    ) -> models.Dex:
+    ) -> _Call[models.Dex]:
         """
         Get summary of DEX volume with historical data.
 
@@ -912,51 +1673,54 @@ class DefiLlama:
 
         API Endpoint: GET /summary/dexs/{protocol}
         """
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-        }
-        data = self._request(
-            "GET", f"{self.BASE_URL}/summary/dexs/{protocol_slug}", params=params
+        params = self._overview_params(
+            self._OVERVIEW_DEFAULT_PARAMS,
+            excludeTotalDataChart=exclude_total_data_chart,
+            excludeTotalDataChartBreakdown=exclude_total_data_chart_breakdown,
         )
-        return models.Dex.model_validate(data)
+        return _Call(self.BASE_URL, f"/summary/dexs/{protocol_slug}", params)
 
-    # TODO: fix this. it's failing to validate the data.
-    async def get_dex_summary_async(
+    get_dex_summary_async = get_dex_summary.aio
+
+    async def get_dex_summaries_bulk_async(
         self,
-        protocol_slug: str,
+        protocol_slugs: Sequence[str],
         exclude_total_data_chart: bool = True,
         exclude_total_data_chart_breakdown: bool = True,
-    ) -> models.Dex:
+        concurrency: int = 20,
+    ) -> List[Union[models.Dex, BaseException]]:
         """
-        Get summary of DEX volume with historical data (async).
+        Get summaries of many DEXs' volume concurrently (async).
 
         Args:
-            protocol_slug (str): Protocol slug (e.g., "uniswap", "sushiswap")
+            protocol_slugs (Sequence[str]): Protocol slugs (e.g., ["uniswap", "sushiswap"])
             exclude_total_data_chart (bool): True to exclude aggregated chart from response (default: True)
             exclude_total_data_chart_breakdown (bool): True to exclude broken down chart from response (default: True)
+            concurrency (int): Maximum number of requests in flight at once (default: 20)
 
         Returns:
-            models.Dex: Summary of DEX volume with historical data
+            List[Union[models.Dex, BaseException]]: DEX summaries in the same order as `protocol_slugs`;
+                                                    failed lookups hold the raised exception
 
         API Endpoint: GET /summary/dexs/{protocol}
         """
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-        }
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}/summary/dexs/{protocol_slug}", params=params
+        return await self._gather_bounded(
+            self.get_dex_summary_async,
+            [
+                (slug, exclude_total_data_chart, exclude_total_data_chart_breakdown)
+                for slug in protocol_slugs
+            ],
+            concurrency,
         )
-        return models.Dex.model_validate(data)
 
+    @_endpoint(models.DexOverviewAdapter)
     def get_options_dexs(
         self,
         chain: Optional[str] = None,
         exclude_total_data_chart: bool = True,
         exclude_total_data_chart_breakdown: bool = True,
         data_type: str = "dailyNotionalVolume",
-    ) -> models.DexOverview:
+    ) -> _Call[models.DexOverview]:
         """
         List all options DEXs along with summaries of their volumes and dataType history data.
 
@@ -973,58 +1737,21 @@ class DefiLlama:
 
         API Endpoint: GET /overview/options or GET /overview/options/{chain}
         """
-        endpoint = "/overview/options"
-        if chain:
-            endpoint = f"{endpoint}/{chain}"
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-            "dataType": data_type,
-        }
-        data = self._request("GET", f"{self.BASE_URL}{endpoint}", params=params)
-        # The API returns a summary object, not a list
-        return models.DexOverview.model_validate(data)
-
-    async def get_options_dexs_async(
-        self,
-        chain: Optional[str] = None,
-        exclude_total_data_chart: bool = True,
-        exclude_total_data_chart_breakdown: bool = True,
-        data_type: str = "dailyNotionalVolume",
-    ) -> models.DexOverview:
-        """
-        List all options DEXs along with summaries of their volumes and dataType history data (async).
-
-        Args:
-            chain (Optional[str]): Chain name to filter by. List of supported chains can be found
-                                  under allChains attribute in /overview/options response.
-            exclude_total_data_chart (bool): True to exclude aggregated chart from response (default: True)
-            exclude_total_data_chart_breakdown (bool): True to exclude broken down chart from response (default: True)
-            data_type (str): Desired data type (default: "dailyNotionalVolume")
-                           Options: "dailyPremiumVolume", "dailyNotionalVolume"
-
-        Returns:
-            models.DexOverview: Overview of all options DEXs with their volume data
-
-        API Endpoint: GET /overview/options or GET /overview/options/{chain}
-        """
-        endpoint = "/overview/options"
-        if chain:
-            endpoint = f"{endpoint}/{chain}"
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-            "dataType": data_type,
-        }
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}{endpoint}", params=params
+        endpoint = f"{self._OPTIONS_PATH}/{chain}" if chain else self._OPTIONS_PATH
+        params = self._overview_params(
+            self._OPTIONS_DEFAULT_PARAMS,
+            excludeTotalDataChart=exclude_total_data_chart,
+            excludeTotalDataChartBreakdown=exclude_total_data_chart_breakdown,
+            dataType=data_type,
         )
-        # The API returns a summary object, not a list
-        return models.DexOverview.model_validate(data)
+        return _Call(self.BASE_URL, endpoint, params)
+
+    get_options_dexs_async = get_options_dexs.aio
 
+    @_endpoint(models.DexAdapter)
     def get_options_dex_summary(
         self, protocol_slug: str, data_type: str = "dailyNotionalVolume"
-    ) -> models.Dex:
+    ) -> _Call[models.Dex]:
         """
         Get summary of options DEX volume with historical data.
 
@@ -1039,40 +1766,18 @@ class DefiLlama:
         API Endpoint: GET /summary/options/{protocol}
         """
         params = {"dataType": data_type}
-        data = self._request(
-            "GET", f"{self.BASE_URL}/summary/options/{protocol_slug}", params=params
-        )
-        return models.Dex.model_validate(data)
-
-    async def get_options_dex_summary_async(
-        self, protocol_slug: str, data_type: str = "dailyNotionalVolume"
-    ) -> models.Dex:
-        """
-        Get summary of options DEX volume with historical data (async).
-
-        Args:
-            protocol_slug (str): Protocol slug (e.g., "derive", "lyra")
-            data_type (str): Desired data type (default: "dailyNotionalVolume")
-                           Options: "dailyPremiumVolume", "dailyNotionalVolume"
+        return _Call(self.BASE_URL, f"/summary/options/{protocol_slug}", params)
 
-        Returns:
-            models.Dex: Summary of options DEX volume with historical data
-
-        API Endpoint: GET /summary/options/{protocol}
-        """
-        params = {"dataType": data_type}
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}/summary/options/{protocol_slug}", params=params
-        )
-        return models.Dex.model_validate(data)
+    get_options_dex_summary_async = get_options_dex_summary.aio
 
+    @_endpoint(models.FeeOverviewAdapter)
     def get_fees(
         self,
         chain: Optional[str] = None,
         exclude_total_data_chart: bool = True,
         exclude_total_data_chart_breakdown: bool = True,
         data_type: Literal["dailyFees", "dailyRevenue"] = "dailyFees",
-    ) -> models.FeeOverview:
+    ) -> _Call[models.FeeOverview]:
         """
         List all protocols along with summaries of their fees and revenue and dataType history data.
 
@@ -1089,60 +1794,23 @@ class DefiLlama:
 
         API Endpoint: GET /overview/fees or GET /overview/fees/{chain}
         """
-        endpoint = "/overview/fees"
-        if chain:
-            endpoint = f"{endpoint}/{chain}"
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-            "dataType": data_type,
-        }
-        data = self._request("GET", f"{self.BASE_URL}{endpoint}", params=params)
-        # The API returns a summary object, not a list
-        return models.FeeOverview.model_validate(data)
-
-    async def get_fees_async(
-        self,
-        chain: Optional[str] = None,
-        exclude_total_data_chart: bool = True,
-        exclude_total_data_chart_breakdown: bool = True,
-        data_type: Literal["dailyFees", "dailyRevenue"] = "dailyFees",
-    ) -> models.FeeOverview:
-        """
-        List all protocols along with summaries of their fees and revenue and dataType history data (async).
-
-        Args:
-            chain (Optional[str]): Chain name to filter by. List of supported chains can be found
-                                  under allChains attribute in /overview/fees response.
-            exclude_total_data_chart (bool): True to exclude aggregated chart from response (default: True)
-            exclude_total_data_chart_breakdown (bool): True to exclude broken down chart from response (default: True)
-            data_type (Literal["dailyFees", "dailyRevenue"]): Desired data type (default: "dailyFees")
-                           Options: "dailyFees", "dailyRevenue"
-
-        Returns:
-            models.FeeOverview: Overview of all protocols with their fees and revenue data
-
-        API Endpoint: GET /overview/fees or GET /overview/fees/{chain}
-        """
-        endpoint = "/overview/fees"
-        if chain:
-            endpoint = f"{endpoint}/{chain}"
-        params = {
-            "excludeTotalDataChart": exclude_total_data_chart,
-            "excludeTotalDataChartBreakdown": exclude_total_data_chart_breakdown,
-            "dataType": data_type,
-        }
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}{endpoint}", params=params
+        endpoint = f"{self._FEES_PATH}/{chain}" if chain else self._FEES_PATH
+        params = self._overview_params(
+            self._FEES_DEFAULT_PARAMS,
+            excludeTotalDataChart=exclude_total_data_chart,
+            excludeTotalDataChartBreakdown=exclude_total_data_chart_breakdown,
+            dataType=data_type,
         )
-        # The API returns a summary object, not a list
-        return models.FeeOverview.model_validate(data)
+        return _Call(self.BASE_URL, endpoint, params)
+
+    get_fees_async = get_fees.aio
 
+    @_endpoint(models.FeeAdapter)
     def get_fee_summary(
         self,
         protocol_slug: str,
         data_type: Literal["dailyFees", "dailyRevenue"] = "dailyFees",
-    ) -> models.Fee:
+    ) -> _Call[models.Fee]:
         """
         Get summary of protocol fees and revenue with historical data.
 
@@ -1157,49 +1825,88 @@ class DefiLlama:
         API Endpoint: GET /summary/fees/{protocol}
         """
         params = {"dataType": data_type}
-        data = self._request(
-            "GET", f"{self.BASE_URL}/summary/fees/{protocol_slug}", params=params
-        )
-        return models.Fee.model_validate(data)
+        return _Call(self.BASE_URL, f"/summary/fees/{protocol_slug}", params)
+
+    get_fee_summary_async = get_fee_summary.aio
 
-    async def get_fee_summary_async(
+    async def get_fee_summaries_bulk_async(
         self,
-        protocol_slug: str,
+        protocol_slugs: Sequence[str],
         data_type: Literal["dailyFees", "dailyRevenue"] = "dailyFees",
-    ) -> models.Fee:
+        concurrency: int = 20,
+    ) -> List[Union[models.Fee, BaseException]]:
         """
-        Get summary of protocol fees and revenue with historical data (async).
+        Get summaries of many protocols' fees and revenue concurrently (async).
 
         Args:
-            protocol_slug (str): Protocol slug (e.g., "uniswap", "aave")
+            protocol_slugs (Sequence[str]): Protocol slugs (e.g., ["uniswap", "aave"])
             data_type (Literal["dailyFees", "dailyRevenue"]): Desired data type (default: "dailyFees")
-                           Options: "dailyFees", "dailyRevenue"
+            concurrency (int): Maximum number of requests in flight at once (default: 20)
 
         Returns:
-            models.Fee: Summary of protocol fees and revenue with historical data
+            List[Union[models.Fee, BaseException]]: Fee summaries in the same order as `protocol_slugs`;
+                                                    failed lookups hold the raised exception
 
         API Endpoint: GET /summary/fees/{protocol}
         """
-        params = {"dataType": data_type}
-        data = await self._async_request(
-            "GET", f"{self.BASE_URL}/summary/fees/{protocol_slug}", params=params
+        return await self._gather_bounded(
+            self.get_fee_summary_async,
+            [(slug, data_type) for slug in protocol_slugs],
+            concurrency,
         )
-        return models.Fee.model_validate(data)
 
     def close(self):
         """
-        Close the synchronous HTTP client.
+        Close the synchronous HTTP clients.
 
         This method should be called when you're done using the client to properly
-        clean up resources and close the underlying HTTP connection.
-        """
-        self.client.close()
+        clean up resources and close the underlying HTTP connections. Requests
+        made after closing raise RuntimeError.
+        """
+        with self._clients_lock:
+            self._closed = True
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+        if self._disk is not None:
+            self._disk.close()
 
     async def aclose(self):
         """
-        Close the asynchronous HTTP client.
+        Close the asynchronous HTTP clients.
 
         This method should be called when you're done using the client to properly
-        clean up resources and close the underlying HTTP connection.
-        """
-        await self.async_client.aclose()
+        clean up resources and close the underlying HTTP connections. Requests made
+        after closing raise RuntimeError.
+        """
+        with self._clients_lock:
+            self._closed = True
+            clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for client in clients:
+            await client.aclose()
+        if self._disk is not None:
+            self._disk.close()
+
+    def __enter__(self) -> DefiLlama:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> DefiLlama:
+        task_group = anyio.create_task_group()
+        await task_group.__aenter__()
+        self._task_group = task_group
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Background refreshes still running are cancelled rather than awaited
+        task_group, self._task_group = self._task_group, None
+        try:
+            if task_group is not None:
+                task_group.cancel_scope.cancel()
+                await task_group.__aexit__(None, None, None)
+        finally:
+            await self.aclose()
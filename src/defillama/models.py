@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, TypeAdapter, AnyHttpUrl
-from typing import List, Dict, Optional, Union, Any
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import TYPE_CHECKING, List, Dict, Optional, Union, Any
 from datetime import datetime
 
 
@@ -12,7 +12,7 @@ class Protocol(BaseModel):
     name: str
     address: Optional[str] = None
     symbol: str
-    url: Optional[AnyHttpUrl | str] = Field(None)
+    url: Optional[str] = None
     description: Optional[str] = None
     chain: Optional[str] = None
     logo: Optional[str] = None
@@ -27,7 +27,7 @@ class Protocol(BaseModel):
     change_7d: Optional[float] = Field(None)
 
 
-Protocols = TypeAdapter(List[Protocol])
+Protocols: TypeAdapter[List[Protocol]] = TypeAdapter(List[Protocol])
 
 
 class Coin(BaseModel):
@@ -46,6 +46,9 @@ class CoinPrice(BaseModel):
     coins: Dict[str, Coin]
 
 
+CoinPriceAdapter: TypeAdapter[CoinPrice] = TypeAdapter(CoinPrice)
+
+
 class HistoricalPrice(BaseModel):
     """Historical price data point"""
 
@@ -67,6 +70,11 @@ class BatchHistoricalPrices(BaseModel):
     coins: Dict[str, CoinHistoricalData]
 
 
+BatchHistoricalPricesAdapter: TypeAdapter[BatchHistoricalPrices] = TypeAdapter(
+    BatchHistoricalPrices
+)
+
+
 class CoinChartData(BaseModel):
     """Chart data for a coin"""
 
@@ -82,12 +90,18 @@ class PriceChart(BaseModel):
     coins: Dict[str, CoinChartData]
 
 
+PriceChartAdapter: TypeAdapter[PriceChart] = TypeAdapter(PriceChart)
+
+
 class PercentageChange(BaseModel):
     """Response model for /percentage/{coins}"""
 
     coins: Dict[str, float]
 
 
+PercentageChangeAdapter: TypeAdapter[PercentageChange] = TypeAdapter(PercentageChange)
+
+
 class Block(BaseModel):
     """Response model for /block/{chain}/{timestamp}"""
 
@@ -95,6 +109,9 @@ class Block(BaseModel):
     timestamp: int
 
 
+BlockAdapter: TypeAdapter[Block] = TypeAdapter(Block)
+
+
 class HistoricalTvl(BaseModel):
     """Historical TVL data point"""
 
@@ -102,7 +119,7 @@ class HistoricalTvl(BaseModel):
     tvl: float
 
 
-HistoricalTvls = TypeAdapter(List[HistoricalTvl])
+HistoricalTvls: TypeAdapter[List[HistoricalTvl]] = TypeAdapter(List[HistoricalTvl])
 
 
 class TokenHistory(BaseModel):
@@ -138,10 +155,14 @@ class ProtocolDetails(Protocol):
         tokens: Optional[List[TokenHistory]] = Field(default=None)
         tokensInUsd: Optional[List[TokenHistory]] = Field(default=None)
 
-    tvl: List[ProtocolHistoricalTvl] = Field(default_factory=list, alias="tvl")
+    # /protocol/{protocol} returns TVL history where /protocols has current values
+    tvl: List[ProtocolHistoricalTvl] = Field(default_factory=list, alias="tvl")  # ty: ignore[invalid-attribute-override]
     tokens: Optional[List[TokenHistory]] = Field(default=None)
     tokensInUsd: Optional[List[TokenHistory]] = Field(default=None)
-    chainTvls: Dict[str, ProtocolChainTvlDetails]
+    chainTvls: Dict[str, ProtocolChainTvlDetails]  # ty: ignore[invalid-attribute-override]
+
+
+ProtocolDetailsAdapter: TypeAdapter[ProtocolDetails] = TypeAdapter(ProtocolDetails)
 
 
 class Chain(BaseModel):
@@ -155,7 +176,7 @@ class Chain(BaseModel):
     chainId: Optional[int] = None
 
 
-Chains = TypeAdapter(List[Chain])
+Chains: TypeAdapter[List[Chain]] = TypeAdapter(List[Chain])
 
 
 class Stablecoin(BaseModel):
@@ -178,7 +199,19 @@ class Stablecoin(BaseModel):
     )
 
 
-Stablecoins = TypeAdapter(List[Stablecoin])
+Stablecoins: TypeAdapter[List[Stablecoin]] = TypeAdapter(List[Stablecoin])
+
+
+class StablecoinsResponse(BaseModel):
+    """Envelope of the /stablecoins response"""
+
+    peggedAssets: List[Stablecoin]
+
+
+# /stablecoins wraps the list as {"peggedAssets": [...]}; a bare list is accepted too
+StablecoinsEnvelope: TypeAdapter[Union[StablecoinsResponse, List[Stablecoin]]] = (
+    TypeAdapter(Union[StablecoinsResponse, List[Stablecoin]])
+)
 
 
 class StablecoinChart(BaseModel):
@@ -189,7 +222,9 @@ class StablecoinChart(BaseModel):
     totalCirculatingUSD: Dict[str, float]
 
 
-StablecoinCharts = TypeAdapter(List[StablecoinChart])
+StablecoinCharts: TypeAdapter[List[StablecoinChart]] = TypeAdapter(
+    List[StablecoinChart]
+)
 
 
 class StablecoinHistorical(BaseModel):
@@ -214,6 +249,11 @@ class StablecoinHistorical(BaseModel):
     chainBalances: Optional[Dict[str, Dict[str, Any]]] = None
 
 
+StablecoinHistoricalAdapter: TypeAdapter[StablecoinHistorical] = TypeAdapter(
+    StablecoinHistorical
+)
+
+
 class StablecoinChainData(BaseModel):
     """Stablecoin chain data"""
 
@@ -223,7 +263,9 @@ class StablecoinChainData(BaseModel):
     name: str
 
 
-StablecoinChains = TypeAdapter(List[StablecoinChainData])
+StablecoinChains: TypeAdapter[List[StablecoinChainData]] = TypeAdapter(
+    List[StablecoinChainData]
+)
 
 
 class StablecoinPrice(BaseModel):
@@ -234,7 +276,9 @@ class StablecoinPrice(BaseModel):
     timestamp: int
 
 
-StablecoinPrices = TypeAdapter(List[StablecoinPrice])
+StablecoinPrices: TypeAdapter[List[StablecoinPrice]] = TypeAdapter(
+    List[StablecoinPrice]
+)
 
 
 class Pool(BaseModel):
@@ -258,7 +302,20 @@ class Pool(BaseModel):
     predictions: Optional[Dict[str, Any]] = None
 
 
-Pools = TypeAdapter(List[Pool])
+Pools: TypeAdapter[List[Pool]] = TypeAdapter(List[Pool])
+
+
+class PoolsResponse(BaseModel):
+    """Envelope of the /pools response"""
+
+    status: Optional[str] = None
+    data: List[Pool]
+
+
+# /pools wraps the list as {"status": "success", "data": [...]}; a bare list is accepted too
+PoolsEnvelope: TypeAdapter[Union[PoolsResponse, List[Pool]]] = TypeAdapter(
+    Union[PoolsResponse, List[Pool]]
+)
 
 
 class PoolChart(BaseModel):
@@ -269,7 +326,19 @@ class PoolChart(BaseModel):
     tvlUsd: float
 
 
-PoolCharts = TypeAdapter(List[PoolChart])
+PoolCharts: TypeAdapter[List[PoolChart]] = TypeAdapter(List[PoolChart])
+
+
+class PoolChartsResponse(BaseModel):
+    """Envelope of the /chart/{pool} response"""
+
+    status: Optional[str] = None
+    data: List[PoolChart]
+
+
+PoolChartsEnvelope: TypeAdapter[Union[PoolChartsResponse, List[PoolChart]]] = (
+    TypeAdapter(Union[PoolChartsResponse, List[PoolChart]])
+)
 
 
 class Volume(BaseModel):
@@ -292,22 +361,28 @@ class Dex(BaseModel):
     methodologyURL: Optional[str] = None
     methodology: Optional[Dict[str, str]] = None
     allChains: Optional[List[str]] = None
-    totalDataChart: Optional[List[List[Union[int, float]]]] = None
-    totalDataChartBreakdown: Optional[List[List[Union[int, float]]]] = None
+    totalDataChart: Optional[List[List[float]]] = None
+    totalDataChartBreakdown: Optional[List[List[float]]] = None
+
+
+DexAdapter: TypeAdapter[Dex] = TypeAdapter(Dex)
 
 
 class DexOverview(BaseModel):
     """DEX overview model for /overview/dexs"""
 
-    totalDataChart: List[List[Union[int, float]]]
-    totalDataChartBreakdown: List[List[Union[int, float]]]
+    totalDataChart: List[List[float]]
+    totalDataChartBreakdown: List[List[float]]
     breakdown24h: Optional[Dict[str, Any]] = None
     breakdown30d: Optional[Dict[str, Any]] = None
     chain: Optional[str] = None
     allChains: List[str]
 
 
-Dexes = TypeAdapter(List[Dex])
+DexOverviewAdapter: TypeAdapter[DexOverview] = TypeAdapter(DexOverview)
+
+
+Dexes: TypeAdapter[List[Dex]] = TypeAdapter(List[Dex])
 
 
 class Fee(BaseModel):
@@ -323,22 +398,28 @@ class Fee(BaseModel):
     methodologyURL: Optional[str] = None
     methodology: Optional[Dict[str, str]] = None
     allChains: Optional[List[str]] = None
-    totalDataChart: Optional[List[List[Union[int, float]]]] = None
-    totalDataChartBreakdown: Optional[List[List[Union[int, float]]]] = None
+    totalDataChart: Optional[List[List[float]]] = None
+    totalDataChartBreakdown: Optional[List[List[float]]] = None
+
+
+FeeAdapter: TypeAdapter[Fee] = TypeAdapter(Fee)
 
 
 class FeeOverview(BaseModel):
     """Fee overview model for /overview/fees"""
 
-    totalDataChart: List[List[Union[int, float]]]
-    totalDataChartBreakdown: List[List[Union[int, float]]]
+    totalDataChart: List[List[float]]
+    totalDataChartBreakdown: List[List[float]]
     breakdown24h: Optional[Dict[str, Any]] = None
     breakdown30d: Optional[Dict[str, Any]] = None
     chain: Optional[str] = None
     allChains: List[str]
 
 
-Fees = TypeAdapter(List[Fee])
+FeeOverviewAdapter: TypeAdapter[FeeOverview] = TypeAdapter(FeeOverview)
+
+
+Fees: TypeAdapter[List[Fee]] = TypeAdapter(List[Fee])
 
 
 class Yield(BaseModel):
@@ -366,3 +447,74 @@ class Yield(BaseModel):
     underlyingTokens: Optional[List[str]] = None
     il7d: Optional[float] = None
     apyBase7d: Optional[float] = None
+
+
+# Optional msgspec mirrors of the hottest list-shaped responses. They are only used
+# when a client is created with decoder="msgspec"; the pydantic models above remain
+# the public contract.
+if TYPE_CHECKING:
+    import msgspec.json
+else:
+    try:
+        import msgspec.json
+    except ImportError:  # pragma: no cover - optional speedup
+        msgspec = None
+
+MSGSPEC_DECODERS: Dict[Any, Any] = {}
+
+if msgspec is not None:
+
+    class ProtocolStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of Protocol"""
+
+        id: str
+        name: str
+        address: Optional[str] = None
+        symbol: str
+        url: Optional[str] = None
+        description: Optional[str] = None
+        chain: Optional[str] = None
+        logo: Optional[str] = None
+        chains: List[str]
+        gecko_id: Optional[str] = None
+        cmcId: Optional[str] = None
+        category: str
+        tvl: Optional[float] = None
+        chainTvls: Dict[str, float]
+        change_1h: Optional[float] = None
+        change_1d: Optional[float] = None
+        change_7d: Optional[float] = None
+
+    class HistoricalPriceStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of HistoricalPrice"""
+
+        timestamp: int
+        price: float
+        confidence: Optional[float] = None
+
+    class CoinChartDataStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of CoinChartData"""
+
+        decimals: Optional[int] = None
+        confidence: Optional[float] = None
+        prices: List[HistoricalPriceStruct]
+        symbol: str
+
+    class PriceChartStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of PriceChart"""
+
+        coins: Dict[str, CoinChartDataStruct]
+
+    class StablecoinChartStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of StablecoinChart"""
+
+        date: str
+        totalCirculating: Dict[str, float]
+        totalCirculatingUSD: Dict[str, float]
+
+    # Keyed by the pydantic adapter/model each decoder stands in for
+    MSGSPEC_DECODERS = {
+        Protocols: msgspec.json.Decoder(List[ProtocolStruct]),
+        PriceChartAdapter: msgspec.json.Decoder(PriceChartStruct),
+        StablecoinCharts: msgspec.json.Decoder(List[StablecoinChartStruct]),
+    }
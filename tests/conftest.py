@@ -0,0 +1,11 @@
+import pytest
+
+
+# The suite builds its own clients against fixture bodies, so a DEFILLAMA_CACHE_DIR
+# from the environment must not mix them with the user's persistent cache. Session
+# scoped so it is unset before module-scoped clients are created.
+@pytest.fixture(scope="session", autouse=True)
+def no_user_disk_cache():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.delenv("DEFILLAMA_CACHE_DIR", raising=False)
+        yield
@@ -0,0 +1,210 @@
+import math
+import time
+from types import SimpleNamespace
+
+import anyio
+import httpx
+import pytest
+from defillama import DefiLlama
+from defillama import cache as cache_module
+
+
+class Api:
+    """Mock transport answering /tvl/{slug} with how many requests it has served"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        if request.url.path.startswith("/block/"):
+            return httpx.Response(200, json={"height": self.requests, "timestamp": 1})
+        return httpx.Response(200, content=str(self.requests).encode())
+
+
+@pytest.fixture
+def api():
+    return Api()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Only the response cache's clock moves; the event loop keeps the real one
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        cache_module, "time", SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+def make_client(api, **kwargs):
+    return DefiLlama(transport=httpx.MockTransport(api), **kwargs)
+
+
+def test_hit_within_ttl(api, clock):
+    with make_client(api) as client:
+        assert client.get_protocol_tvl("aave") == 1.0
+        clock.value += DefiLlama._DEFAULT_CACHE_TTL - 1
+        assert client.get_protocol_tvl("aave") == 1.0
+    assert api.requests == 1
+
+
+def test_refetch_after_expiry(api, clock):
+    with make_client(api) as client:
+        assert client.get_protocol_tvl("aave") == 1.0
+        clock.value += DefiLlama._DEFAULT_CACHE_TTL + 1
+        assert client.get_protocol_tvl("aave") == 2.0
+    assert api.requests == 2
+
+
+async def test_async_serves_stale_and_refreshes(api, clock):
+    async with make_client(api) as client:
+        assert await client.get_protocol_tvl_async("aave") == 1.0
+        clock.value += DefiLlama._DEFAULT_CACHE_TTL + 1
+        # Expired but within the stale window: the old body comes back straight
+        # away while a refresh runs in the background
+        assert await client.get_protocol_tvl_async("aave") == 1.0
+        while client._refreshing:
+            await anyio.sleep(0)
+        assert api.requests == 2
+        assert await client.get_protocol_tvl_async("aave") == 2.0
+    assert api.requests == 2
+
+
+async def test_async_stale_without_task_group_waits_for_refetch(api, clock):
+    client = make_client(api)
+    assert await client.get_protocol_tvl_async("aave") == 1.0
+    clock.value += DefiLlama._DEFAULT_CACHE_TTL + 1
+    # Outside `async with` there is nothing to run a background refresh in
+    assert await client.get_protocol_tvl_async("aave") == 2.0
+    await client.aclose()
+
+
+async def test_exit_cancels_background_refresh(clock):
+    started = anyio.Event()
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        if len(requests) > 1:
+            started.set()
+            await anyio.sleep_forever()
+        return httpx.Response(200, content=b"1")
+
+    async with make_client(handler) as client:
+        assert await client.get_protocol_tvl_async("aave") == 1.0
+        clock.value += DefiLlama._DEFAULT_CACHE_TTL + 1
+        assert await client.get_protocol_tvl_async("aave") == 1.0
+        await started.wait()
+    assert not client._refreshing
+    assert len(requests) == 2
+
+
+def test_cache_disabled(api):
+    with make_client(api, cache=False) as client:
+        assert client.get_protocol_tvl("aave") == 1.0
+        assert client.get_protocol_tvl("aave") == 2.0
+    assert api.requests == 2
+
+
+def test_immutable_responses_never_expire(api, clock):
+    with make_client(api) as client:
+        assert client.get_block("ethereum", 1700000000).height == 1
+        clock.value += 10 * 365 * 86400
+        assert client.get_block("ethereum", 1700000000).height == 1
+    assert api.requests == 1
+
+
+def test_clear_cache(api):
+    with make_client(api) as client:
+        assert client.get_protocol_tvl("aave") == 1.0
+        client.clear_cache()
+        assert client.get_protocol_tvl("aave") == 2.0
+    assert api.requests == 2
+
+
+def test_lru_eviction():
+    cache = cache_module.ResponseCache(maxsize=2)
+    cache.set("a", b"1", math.inf)
+    cache.set("b", b"2", math.inf)
+    cache.get("a")
+    cache.set("c", b"3", math.inf)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+
+def test_http_cache_stays_out_of_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    with make_client(Api(), http_cache=True) as client:
+        client.get_protocol_tvl("aave")
+    assert any((tmp_path / "xdg" / "defillama" / "http").iterdir())
+    assert not (tmp_path / ".cache").exists()
+
+
+def test_disk_cache_shared_across_clients(api, tmp_path):
+    with make_client(api, cache_dir=str(tmp_path)) as client:
+        assert client.get_block("ethereum", 1700000000).height == 1
+    with make_client(api, cache_dir=str(tmp_path)) as client:
+        assert client.get_block("ethereum", 1700000000).height == 1
+    assert api.requests == 1
+
+
+def test_disk_hit_promoted_to_memory(api, tmp_path):
+    with make_client(api, cache_dir=str(tmp_path)) as client:
+        client.get_block("ethereum", 1700000000)
+    with make_client(api, cache_dir=str(tmp_path)) as client:
+        client.get_block("ethereum", 1700000000)
+        client._disk.clear()
+        assert client.get_block("ethereum", 1700000000).height == 1
+    assert api.requests == 1
+
+
+def test_disk_cache_skips_expiring_responses(api, tmp_path):
+    with make_client(api, cache_dir=str(tmp_path)) as client:
+        client.get_protocol_tvl("aave")
+        assert len(client._disk) == 0
+
+
+def test_close_closes_disk_cache(api, tmp_path, monkeypatch):
+    client = make_client(api, cache_dir=str(tmp_path))
+    closed = []
+    monkeypatch.setattr(client._disk, "close", lambda: closed.append(True))
+    client.close()
+    assert closed == [True]
+
+
+def test_disk_cache_dir_from_environment(api, tmp_path, monkeypatch):
+    monkeypatch.setenv("DEFILLAMA_CACHE_DIR", str(tmp_path))
+    with make_client(api) as client:
+        assert client._disk is not None
+    with make_client(api, cache_dir=False) as client:
+        assert client._disk is None
+
+
+def test_recent_lookups_expire(api, clock):
+    settled = int(time.time()) - 2 * DefiLlama._SETTLED_AGE
+    latest = int(time.time())
+    with make_client(api) as client:
+        client.get_block("ethereum", settled)
+        client.get_block("ethereum", latest)
+        clock.value += DefiLlama._DEFAULT_CACHE_TTL + 1
+        client.get_block("ethereum", settled)
+        assert client.get_block("ethereum", latest).height == 3
+    assert api.requests == 3
+
+
+def test_empty_price_lookups_expire(clock, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"coins": {}})
+
+    client = DefiLlama(transport=httpx.MockTransport(handler), cache_dir=str(tmp_path))
+    with client:
+        assert client.get_first_prices(["coingecko:new-coin"]).coins == {}
+        assert len(client._disk) == 0
+        clock.value += DefiLlama._DEFAULT_CACHE_TTL + 1
+        client.get_first_prices(["coingecko:new-coin"])
+    assert len(requests) == 2
@@ -1,399 +1,462 @@
+import asyncio
+import contextlib
+import inspect
+import os
+import time
+import typing
+from pathlib import Path
+
+import httpx
 import pytest
-import pytest_asyncio
+import respx
+import vcr
 from defillama import DefiLlama
 from defillama import models
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Fixed once per module so every test asks for the same URLs
+TS_24H_AGO = int(time.time()) - 86400
+TS_3D_AGO = TS_24H_AGO - 86400 * 2
+
+# Structural tests are served from the JSON bodies in tests/fixtures; only tests
+# marked `integration` talk to the live API (run them with `pytest -m integration`).
+FIXTURE_ROUTES = [
+    (r"^https://api\.llama\.fi/protocols$", "protocols"),
+    (r"^https://api\.llama\.fi/protocol/aave-v3$", "protocol"),
+    (r"^https://api\.llama\.fi/v2/chains$", "chains"),
+    (r"^https://api\.llama\.fi/overview/dexs", "dexs"),
+    (r"^https://api\.llama\.fi/overview/fees", "fees"),
+    (r"^https://api\.llama\.fi/summary/dexs/(uniswap|curve)\?", "dex_summary"),
+    (r"^https://api\.llama\.fi/summary/fees/(uniswap|curve)\?", "fee_summary"),
+    (r"^https://coins\.llama\.fi/prices/(current|first|historical/\d+)/", "prices"),
+    (r"^https://coins\.llama\.fi/block/ethereum/\d+$", "block"),
+    (r"^https://stablecoins\.llama\.fi/stablecoins", "stablecoins"),
+    (r"^https://stablecoins\.llama\.fi/stablecoincharts/all$", "stablecoin_charts"),
+    (r"^https://stablecoins\.llama\.fi/stablecoin/1$", "stablecoin_historical"),
+    (r"^https://stablecoins\.llama\.fi/stablecoinchains$", "stablecoin_chains"),
+    (r"^https://yields\.llama\.fi/pools$", "pools"),
+    (r"^https://yields\.llama\.fi/chart/pool-[ab]$", "pool_chart"),
+]
+
+
+@pytest.fixture(scope="module")
+def mock_router():
+    router = respx.Router(assert_all_called=False)
+    for pattern, name in FIXTURE_ROUTES:
+        router.get(url__regex=pattern).respond(
+            content=(FIXTURES / f"{name}.json").read_bytes(),
+            headers={"Content-Type": "application/json"},
+        )
+    router.route().respond(404, json={"message": "Not Found"})
+    return router
+
+
+@pytest.fixture(scope="module")
+def mocked_client(mock_router):
+    client = DefiLlama(transport=httpx.MockTransport(mock_router.handler))
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+async def mocked_async_client(mock_router):
+    client = DefiLlama(transport=httpx.MockTransport(mock_router.handler))
+    yield client
+    await client.aclose()
 
-@pytest.fixture
+
+# One client per module so its pooled connections are reused across tests instead
+# of paying a fresh TCP + TLS handshake in every test.
+@pytest.fixture(scope="module")
 def client():
-    return DefiLlama()
+    client = DefiLlama()
+    yield client
+    client.close()
 
 
-@pytest_asyncio.fixture
+# The async client's connections are bound to the event loop that opened them, so
+# the fixtures and tests share one module-scoped loop (see asyncio_* in pyproject.toml).
+@pytest.fixture(scope="module")
 async def async_client():
     client = DefiLlama()
     yield client
     await client.aclose()
 
 
-def test_get_protocols(client):
-    protocols = client.get_protocols()
-    assert isinstance(protocols, list)
-    assert len(protocols) > 0
-    # Check for a well-known protocol to ensure the list is populated
-    assert any(p.name == "AAVE V3" for p in protocols)
+# Endpoint tests run once against each client: `api` is a (client, method suffix) pair
+# and `call` invokes `<name><suffix>`, awaiting the result for the async variant.
+@pytest.fixture(params=["sync", "async"])
+def api(request):
+    if request.param == "sync":
+        return request.getfixturevalue("mocked_client"), ""
+    return request.getfixturevalue("mocked_async_client"), "_async"
+
+
+# Integration tests hit the live API. No cassettes are committed; the first run saves
+# the responses under tests/cassettes/test_client/ (`--record-mode=once`, see
+# pyproject.toml) for later local runs, and `pytest -m integration --record-mode=rewrite`
+# refetches them. Module-scoped fixtures are set up before a test's own `vcr` cassette
+# is entered, so they save into their own.
+def fixture_cassette(vcr_cassette_dir, record_mode, name):
+    path = os.path.join(vcr_cassette_dir, f"{name}.yaml")
+    if record_mode == "rewrite":
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        record_mode = "new_episodes"
+    return vcr.VCR(record_mode=record_mode).use_cassette(path)
+
+
+# `/protocols` is a multi-megabyte payload, so each client fetches and validates it
+# once per module and every test that needs the full list shares the result.
+@pytest.fixture(scope="module")
+def all_protocols(client, vcr_cassette_dir, record_mode):
+    with fixture_cassette(vcr_cassette_dir, record_mode, "all_protocols"):
+        return client.get_protocols()
+
+
+@pytest.fixture(scope="module")
+async def all_protocols_async(async_client, vcr_cassette_dir, record_mode):
+    with fixture_cassette(vcr_cassette_dir, record_mode, "all_protocols_async"):
+        return await async_client.get_protocols_async()
 
 
-@pytest.mark.asyncio
-async def test_get_protocols_async(async_client):
-    protocols = await async_client.get_protocols_async()
+@pytest.fixture(scope="module")
+def protocol_names(all_protocols):
+    return {p.name for p in all_protocols}
+
+
+@pytest.fixture(scope="module")
+def protocol_names_async(all_protocols_async):
+    return {p.name for p in all_protocols_async}
+
+
+ETH_BTC = ["coingecko:ethereum", "coingecko:bitcoin"]
+
+
+# The coins endpoint takes a comma-separated batch, so both coins come back from one
+# request that every price test can index into.
+@pytest.fixture(scope="module")
+def prices_eth_btc(mocked_client):
+    return mocked_client.get_current_prices(coins=ETH_BTC)
+
+
+async def call(api, name, *args, **kwargs):
+    client, suffix = api
+    result = getattr(client, name + suffix)(*args, **kwargs)
+    return await result if inspect.isawaitable(result) else result
+
+
+def assert_fields(obj, *names):
+    """Assert that `obj`'s model declares every field in `names`"""
+    assert set(names) <= type(obj).model_fields.keys()
+
+
+async def gather_with_concurrency(n, *coros):
+    """Await `coros` concurrently with at most `n` requests in flight, in order"""
+    semaphore = asyncio.Semaphore(n)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(bounded(coro) for coro in coros))
+
+
+@pytest.mark.integration
+@pytest.mark.vcr
+@pytest.mark.parametrize("suffix", ["", "_async"], ids=["sync", "async"])
+def test_get_protocols(request, suffix):
+    protocols = request.getfixturevalue("all_protocols" + suffix)
     assert isinstance(protocols, list)
     assert len(protocols) > 0
     # Check for a well-known protocol to ensure the list is populated
-    assert any(p.name == "AAVE V3" for p in protocols)
+    assert "AAVE V3" in request.getfixturevalue("protocol_names" + suffix)
 
 
-def test_get_protocol(client):
+async def test_get_protocol(api):
     # Test with a well-known protocol slug
-    protocol = client.get_protocol("aave-v3")
+    protocol = await call(api, "get_protocol", "aave-v3")
     assert protocol is not None
     assert protocol.name == "AAVE V3"
     assert isinstance(protocol.tvl, list)
     # Check that the TVL list contains data points
     assert len(protocol.tvl) > 0
-    assert "date" in protocol.tvl[0].model_dump()
-    assert "totalLiquidityUSD" in protocol.tvl[0].model_dump()
+    assert_fields(protocol.tvl[0], "date", "totalLiquidityUSD")
 
 
-@pytest.mark.asyncio
-async def test_get_protocol_async(async_client):
-    # Test with a well-known protocol slug
-    protocol = await async_client.get_protocol_async("aave-v3")
-    assert protocol is not None
-    assert protocol.name == "AAVE V3"
-    assert isinstance(protocol.tvl, list)
-    # Check that the TVL list contains data points
-    assert len(protocol.tvl) > 0
-    assert "date" in protocol.tvl[0].model_dump()
-    assert "totalLiquidityUSD" in protocol.tvl[0].model_dump()
-
-
-def test_get_nonexistent_protocol(client):
+async def test_get_nonexistent_protocol(api):
     with pytest.raises(ValueError) as excinfo:
-        client.get_protocol("nonexistent-protocol-slug")
+        await call(api, "get_protocol", "nonexistent-protocol-slug")
     # Check for a 404 or other client/server error status
     assert isinstance(excinfo.value, ValueError)
     assert "HTTP error" in str(excinfo.value)
     assert "400" in str(excinfo.value) or "404" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
-async def test_get_nonexistent_protocol_async(async_client):
-    with pytest.raises(ValueError) as excinfo:
-        await async_client.get_protocol_async("nonexistent-protocol-slug")
-    # Check for a 404 or other client/server error status
-    assert isinstance(excinfo.value, ValueError)
-    assert "HTTP error" in str(excinfo.value)
-    assert "400" in str(excinfo.value) or "404" in str(excinfo.value)
-
-
-def test_get_chains(client):
-    chains = client.get_chains()
+async def test_get_chains(api):
+    chains = await call(api, "get_chains")
     assert isinstance(chains, list)
     assert len(chains) > 0
     # Check structure of first chain
     first_chain = chains[0]
-    assert hasattr(first_chain, "name")
-    assert hasattr(first_chain, "chainId")
-    assert hasattr(first_chain, "tvl")
+    assert_fields(first_chain, "name", "chainId", "tvl")
 
 
-@pytest.mark.asyncio
-async def test_get_chains_async(async_client):
-    chains = await async_client.get_chains_async()
-    assert isinstance(chains, list)
-    assert len(chains) > 0
-    # Check structure of first chain
-    first_chain = chains[0]
-    assert hasattr(first_chain, "name")
-    assert hasattr(first_chain, "chainId")
-    assert hasattr(first_chain, "tvl")
-
-
-def test_get_current_prices(client):
-    prices = client.get_current_prices(coins=["coingecko:ethereum"])
-    assert isinstance(prices, models.CoinPrice)
-    assert "coins" in prices.model_dump()
-
-
-@pytest.mark.asyncio
-async def test_get_current_prices_async(async_client):
-    prices = await async_client.get_current_prices_async(coins=["coingecko:ethereum"])
-    assert isinstance(prices, models.CoinPrice)
-    assert "coins" in prices.model_dump()
-
-
-def test_get_historical_prices(client):
-    import time
-
-    timestamp = int(time.time()) - 86400  # 24 hours ago
-    prices = client.get_historical_prices(
-        timestamp=timestamp, coins=["coingecko:ethereum"]
-    )
+async def test_get_current_prices(api):
+    prices = await call(api, "get_current_prices", coins=["coingecko:ethereum"])
     assert isinstance(prices, models.CoinPrice)
-    assert "coins" in prices.model_dump()
-
+    assert_fields(prices, "coins")
 
-@pytest.mark.asyncio
-async def test_get_historical_prices_async(async_client):
-    import time
 
-    timestamp = int(time.time()) - 86400  # 24 hours ago
-    prices = await async_client.get_historical_prices_async(
-        timestamp=timestamp, coins=["coingecko:ethereum"]
+async def test_get_historical_prices(api):
+    prices = await call(
+        api, "get_historical_prices", timestamp=TS_24H_AGO, coins=["coingecko:ethereum"]
     )
     assert isinstance(prices, models.CoinPrice)
-    assert "coins" in prices.model_dump()
+    assert_fields(prices, "coins")
 
 
-def test_get_first_prices(client):
-    prices = client.get_first_prices(coins=["coingecko:ethereum"])
+async def test_get_first_prices(api):
+    prices = await call(api, "get_first_prices", coins=["coingecko:ethereum"])
     assert isinstance(prices, models.CoinPrice)
-    assert "coins" in prices.model_dump()
-
-
-@pytest.mark.asyncio
-async def test_get_first_prices_async(async_client):
-    prices = await async_client.get_first_prices_async(coins=["coingecko:ethereum"])
-    assert isinstance(prices, models.CoinPrice)
-    assert "coins" in prices.model_dump()
-
+    assert_fields(prices, "coins")
 
-def test_get_block(client):
-    from datetime import datetime
 
+async def test_get_block(api):
     # Use Ethereum chain and a timestamp from a few days ago
-    block = client.get_block(
-        chain="ethereum",
-        timestamp=int(datetime.now().timestamp() - 86400 * 3),  # 3 days ago
-    )
+    block = await call(api, "get_block", chain="ethereum", timestamp=TS_3D_AGO)
     assert isinstance(block, models.Block)
-    assert hasattr(block, "height")
-    assert hasattr(block, "timestamp")
-
+    assert_fields(block, "height", "timestamp")
 
-@pytest.mark.asyncio
-async def test_get_block_async(async_client):
-    from datetime import datetime
 
-    # Use Ethereum chain and a timestamp from a few days ago
-    block = await async_client.get_block_async(
-        chain="ethereum",
-        timestamp=int(datetime.now().timestamp() - 86400 * 3),  # 3 days ago
-    )
-    assert isinstance(block, models.Block)
-    assert hasattr(block, "height")
-    assert hasattr(block, "timestamp")
-
-
-def test_get_stablecoins(client):
+async def test_get_stablecoins(api):
     """Test stablecoins endpoint with proper model validation"""
-    stablecoins = client.get_stablecoins()
+    stablecoins = await call(api, "get_stablecoins")
     assert isinstance(stablecoins, list)
     assert len(stablecoins) > 0
     # Check structure of first stablecoin
     first_stablecoin = stablecoins[0]
-    assert hasattr(first_stablecoin, "id")
-    assert hasattr(first_stablecoin, "name")
-    assert hasattr(first_stablecoin, "symbol")
-    assert hasattr(first_stablecoin, "circulating")
+    assert_fields(first_stablecoin, "id", "name", "symbol", "circulating")
 
 
-@pytest.mark.asyncio
-async def test_get_stablecoins_async(async_client):
-    """Test stablecoins endpoint with proper model validation"""
-    stablecoins = await async_client.get_stablecoins_async()
-    assert isinstance(stablecoins, list)
-    assert len(stablecoins) > 0
-    # Check structure of first stablecoin
-    first_stablecoin = stablecoins[0]
-    assert hasattr(first_stablecoin, "id")
-    assert hasattr(first_stablecoin, "name")
-    assert hasattr(first_stablecoin, "symbol")
-    assert hasattr(first_stablecoin, "circulating")
-
-
-def test_get_stablecoin_charts(client):
+async def test_get_stablecoin_charts(api):
     """Test stablecoin charts endpoint with proper model validation"""
-    charts = client.get_stablecoin_charts()
+    charts = await call(api, "get_stablecoin_charts")
     assert isinstance(charts, list)
     if len(charts) > 0:
         first_chart = charts[0]
-        assert hasattr(first_chart, "date")
-        assert hasattr(first_chart, "totalCirculating")
-        assert hasattr(first_chart, "totalCirculatingUSD")
+        assert_fields(first_chart, "date", "totalCirculating", "totalCirculatingUSD")
         # Check that date is a string and circulating values are dictionaries
         assert isinstance(first_chart.date, str)
         assert isinstance(first_chart.totalCirculating, dict)
         assert isinstance(first_chart.totalCirculatingUSD, dict)
 
 
-@pytest.mark.asyncio
-async def test_get_stablecoin_charts_async(async_client):
-    """Test stablecoin charts endpoint with proper model validation"""
-    charts = await async_client.get_stablecoin_charts_async()
-    assert isinstance(charts, list)
-    if len(charts) > 0:
-        first_chart = charts[0]
-        assert hasattr(first_chart, "date")
-        assert hasattr(first_chart, "totalCirculating")
-        assert hasattr(first_chart, "totalCirculatingUSD")
-        # Check that date is a string and circulating values are dictionaries
-        assert isinstance(first_chart.date, str)
-        assert isinstance(first_chart.totalCirculating, dict)
-        assert isinstance(first_chart.totalCirculatingUSD, dict)
-
-
-def test_get_stablecoin_chains(client):
-    """Test stablecoin chains endpoint with proper model validation"""
-    chains = client.get_stablecoin_chains()
-    assert isinstance(chains, list)
-    if len(chains) > 0:
-        first_chain = chains[0]
-        assert hasattr(first_chain, "name")
-        assert hasattr(first_chain, "totalCirculatingUSD")
-        assert hasattr(first_chain, "gecko_id")
-        assert hasattr(first_chain, "tokenSymbol")
-        # Check that totalCirculatingUSD is a dictionary
-        assert isinstance(first_chain.totalCirculatingUSD, dict)
-
-
-@pytest.mark.asyncio
-async def test_get_stablecoin_chains_async(async_client):
+async def test_get_stablecoin_chains(api):
     """Test stablecoin chains endpoint with proper model validation"""
-    chains = await async_client.get_stablecoin_chains_async()
+    chains = await call(api, "get_stablecoin_chains")
     assert isinstance(chains, list)
     if len(chains) > 0:
         first_chain = chains[0]
-        assert hasattr(first_chain, "name")
-        assert hasattr(first_chain, "totalCirculatingUSD")
-        assert hasattr(first_chain, "gecko_id")
-        assert hasattr(first_chain, "tokenSymbol")
+        assert_fields(
+            first_chain, "name", "totalCirculatingUSD", "gecko_id", "tokenSymbol"
+        )
         # Check that totalCirculatingUSD is a dictionary
         assert isinstance(first_chain.totalCirculatingUSD, dict)
 
 
-def test_get_stablecoin_historical(client):
-    """Test stablecoin historical endpoint with proper model validation"""
-    # Test with Tether (ID: 1)
-    historical = client.get_stablecoin_historical(1)
-    assert isinstance(historical, models.StablecoinHistorical)
-    assert historical.id == "1"
-    assert historical.name == "Tether"
-    assert historical.symbol == "USDT"
-    assert hasattr(historical, "pegType")
-    assert hasattr(historical, "pegMechanism")
-    assert hasattr(historical, "chainBalances")
-
-
-@pytest.mark.asyncio
-async def test_get_stablecoin_historical_async(async_client):
+async def test_get_stablecoin_historical(api):
     """Test stablecoin historical endpoint with proper model validation"""
     # Test with Tether (ID: 1)
-    historical = await async_client.get_stablecoin_historical_async(1)
+    historical = await call(api, "get_stablecoin_historical", 1)
     assert isinstance(historical, models.StablecoinHistorical)
     assert historical.id == "1"
     assert historical.name == "Tether"
     assert historical.symbol == "USDT"
-    assert hasattr(historical, "pegType")
-    assert hasattr(historical, "pegMechanism")
-    assert hasattr(historical, "chainBalances")
+    assert_fields(historical, "pegType", "pegMechanism", "chainBalances")
 
 
-def test_get_pools(client):
+async def test_get_pools(api):
     """Test pools endpoint with proper model validation"""
-    pools = client.get_pools()
+    pools = await call(api, "get_pools")
     assert isinstance(pools, list)
     if len(pools) > 0:
         first_pool = pools[0]
-        assert hasattr(first_pool, "chain")
-        assert hasattr(first_pool, "project")
-        assert hasattr(first_pool, "symbol")
-        assert hasattr(first_pool, "tvlUsd")
-        assert hasattr(first_pool, "apy")
+        assert_fields(first_pool, "chain", "project", "symbol", "tvlUsd", "apy")
 
 
-@pytest.mark.asyncio
-async def test_get_pools_async(async_client):
-    """Test pools endpoint with proper model validation"""
-    pools = await async_client.get_pools_async()
-    assert isinstance(pools, list)
-    if len(pools) > 0:
-        first_pool = pools[0]
-        assert hasattr(first_pool, "chain")
-        assert hasattr(first_pool, "project")
-        assert hasattr(first_pool, "symbol")
-        assert hasattr(first_pool, "tvlUsd")
-        assert hasattr(first_pool, "apy")
+async def test_get_pool_chart(api):
+    """Test pool chart endpoint unwrapping the data envelope"""
+    chart = await call(api, "get_pool_chart", "pool-a")
+    assert [point.apy for point in chart] == [3.2, 3.4]
+    assert all(isinstance(point, models.PoolChart) for point in chart)
 
 
-def test_get_dexs(client):
-    """Test DEXs endpoint with proper model validation"""
-    dexs = client.get_dexs()
-    assert isinstance(dexs, models.DexOverview)
-    assert hasattr(dexs, "allChains")
-    assert isinstance(dexs.allChains, list)
+async def test_get_pool_charts_bulk(mocked_async_client):
+    """Test that bulk pool charts come back in order, with failures in place"""
+    charts = await mocked_async_client.get_pool_charts_bulk_async(
+        ["pool-a", "missing", "pool-b"], concurrency=2
+    )
+    assert [point.tvlUsd for point in charts[0]] == [150000000.0, 152000000.0]
+    assert isinstance(charts[1], ValueError)
+    assert charts[2] == charts[0]
 
 
-@pytest.mark.asyncio
-async def test_get_dexs_async(async_client):
+async def test_get_dexs(api):
     """Test DEXs endpoint with proper model validation"""
-    dexs = await async_client.get_dexs_async()
+    dexs = await call(api, "get_dexs")
     assert isinstance(dexs, models.DexOverview)
-    assert hasattr(dexs, "allChains")
+    assert_fields(dexs, "allChains")
     assert isinstance(dexs.allChains, list)
 
 
-def test_get_fees(client):
+async def test_get_fees(api):
     """Test fees endpoint with proper model validation"""
-    fees = client.get_fees()
+    fees = await call(api, "get_fees")
     assert isinstance(fees, models.FeeOverview)
-    assert hasattr(fees, "allChains")
+    assert_fields(fees, "allChains")
     assert isinstance(fees.allChains, list)
 
 
-@pytest.mark.asyncio
-async def test_get_fees_async(async_client):
-    """Test fees endpoint with proper model validation"""
-    fees = await async_client.get_fees_async()
-    assert isinstance(fees, models.FeeOverview)
-    assert hasattr(fees, "allChains")
-    assert isinstance(fees.allChains, list)
+async def test_get_dex_summaries_bulk(mocked_async_client):
+    """Test bulk DEX summaries with proper model validation"""
+    summaries = await mocked_async_client.get_dex_summaries_bulk_async(
+        ["uniswap", "curve", "missing"]
+    )
+    assert all(isinstance(s, models.Dex) for s in summaries[:2])
+    assert summaries[0].dailyVolume == 1200000000.0
+    assert isinstance(summaries[2], ValueError)
 
 
-def test_model_validation_coin_with_confidence(client):
-    """Test that Coin model properly validates responses with confidence field"""
-    # Test with a coin that should have confidence data
-    prices = client.get_current_prices(coins=["coingecko:ethereum"])
+async def test_get_fee_summaries_bulk(mocked_async_client):
+    """Test bulk fee summaries with proper model validation"""
+    summaries = await mocked_async_client.get_fee_summaries_bulk_async(
+        ["uniswap", "curve", "missing"], data_type="dailyRevenue"
+    )
+    assert all(isinstance(s, models.Fee) for s in summaries[:2])
+    assert summaries[0].totalFees == 4000000000.0
+    assert isinstance(summaries[2], ValueError)
+
+
+@pytest.mark.integration
+@pytest.mark.vcr
+async def test_all_async_endpoints_gathered(async_client):
+    """Fire the read-only async endpoints as one concurrent batch"""
+    (
+        chains,
+        prices,
+        stablecoins,
+        stablecoin_chains,
+        pools,
+        dexs,
+        fees,
+    ) = await gather_with_concurrency(
+        10,
+        async_client.get_chains_async(),
+        async_client.get_current_prices_async(coins=ETH_BTC),
+        async_client.get_stablecoins_async(),
+        async_client.get_stablecoin_chains_async(),
+        async_client.get_pools_async(),
+        async_client.get_dexs_async(),
+        async_client.get_fees_async(),
+    )
+    assert len(chains) > 0
     assert isinstance(prices, models.CoinPrice)
-    coins_data = prices.coins
-    assert isinstance(coins_data, dict)
-    if "coingecko:ethereum" in coins_data:
-        eth_data = coins_data["coingecko:ethereum"]
-        # Confidence field should be present (may be None)
-        assert hasattr(eth_data, "confidence")
+    assert len(stablecoins) > 0
+    assert isinstance(stablecoin_chains, list)
+    assert isinstance(pools, list)
+    assert isinstance(dexs, models.DexOverview)
+    assert isinstance(fees, models.FeeOverview)
 
 
-def test_model_validation_coin_without_confidence(client):
-    """Test that Coin model properly validates responses without confidence field"""
-    # Test with a coin that might not have confidence data
-    prices = client.get_current_prices(coins=["coingecko:bitcoin"])
-    assert isinstance(prices, models.CoinPrice)
-    coins_data = prices.coins
-    assert isinstance(coins_data, dict)
-    if "coingecko:bitcoin" in coins_data:
-        btc_data = coins_data["coingecko:bitcoin"]
-        # Confidence field should be present (may be None)
-        assert hasattr(btc_data, "confidence")
+def test_msgspec_decoder(mock_router):
+    """Test that decoder="msgspec" decodes the same payloads into Structs"""
+    with DefiLlama(
+        decoder="msgspec", transport=httpx.MockTransport(mock_router.handler)
+    ) as client:
+        protocols = client.get_protocols()
+        charts = client.get_stablecoin_charts()
+    assert all(isinstance(p, models.ProtocolStruct) for p in protocols)
+    assert [p.name for p in protocols] == ["AAVE V3", "Uniswap V3"]
+    assert protocols[0].chainTvls["Ethereum"] == 20000000000.0
+    assert all(isinstance(c, models.StablecoinChartStruct) for c in charts)
+    assert charts[0].totalCirculatingUSD == {"peggedUSD": 125000000000.0}
+
+
+def test_endpoint_annotations():
+    """Test that generated endpoint methods advertise the type they return"""
+    assert typing.get_type_hints(DefiLlama.get_protocols) == {
+        "return": typing.List[models.Protocol]
+    }
+    hints = typing.get_type_hints(DefiLlama.get_block_async)
+    assert hints == {"chain": str, "timestamp": int, "return": models.Block}
+    assert inspect.iscoroutinefunction(DefiLlama.get_block_async)
+    assert DefiLlama.get_block_async.__name__ == "get_block_async"
+
+
+def test_every_endpoint_is_annotated():
+    """Test that no generated endpoint method leaks the builder's _Call annotation"""
+    endpoints = [name for name, attr in vars(DefiLlama).items() if hasattr(attr, "aio")]
+    assert len(endpoints) == 24
+    for name in endpoints:
+        for method in (getattr(DefiLlama, name), getattr(DefiLlama, name + "_async")):
+            returns = typing.get_type_hints(method)["return"]
+            assert "_Call" not in repr(returns), method.__qualname__
+
+
+@pytest.mark.parametrize(
+    "body, expected", [(b"1.5", 1.5), (b"42", 42.0), (b" 1e3\n", 1000.0)]
+)
+def test_parse_float(body, expected):
+    """Test that scalar bodies parse as JSON numbers"""
+    assert DefiLlama._parse_float(body) == expected
+
+
+@pytest.mark.parametrize(
+    "body", [b"null", b"true", b'"1.5"', b"nan", b"inf", b"1_0", b"", b"oops"]
+)
+def test_parse_float_rejects_non_numbers(body):
+    """Test that anything but a finite JSON number raises ValueError"""
+    with pytest.raises(ValueError):
+        DefiLlama._parse_float(body)
+
+
+def test_model_validation_coin_with_confidence(prices_eth_btc):
+    """Test that Coin model properly validates responses with confidence field"""
+    assert isinstance(prices_eth_btc, models.CoinPrice)
+    eth_data = prices_eth_btc.coins["coingecko:ethereum"]
+    assert_fields(eth_data, "confidence")
+    assert eth_data.confidence == 0.99
 
 
-@pytest.mark.asyncio
-async def test_async_sync_consistency(async_client, client):
+def test_model_validation_coin_without_confidence(prices_eth_btc):
+    """Test that Coin model properly validates responses without confidence field"""
+    assert isinstance(prices_eth_btc, models.CoinPrice)
+    btc_data = prices_eth_btc.coins["coingecko:bitcoin"]
+    # The bitcoin fixture has no confidence, so the field falls back to None
+    assert_fields(btc_data, "confidence")
+    assert btc_data.confidence is None
+
+
+@pytest.mark.integration
+@pytest.mark.vcr
+async def test_async_sync_consistency(
+    async_client,
+    client,
+    all_protocols,
+    all_protocols_async,
+    protocol_names,
+    protocol_names_async,
+):
     """Test that async and sync methods return the same results"""
     # Test protocols
-    sync_protocols = client.get_protocols()
-    async_protocols = await async_client.get_protocols_async()
-
-    assert len(sync_protocols) == len(async_protocols)
+    assert len(all_protocols) == len(all_protocols_async)
     # Check that they contain the same protocols (by name)
-    sync_names = {p.name for p in sync_protocols}
-    async_names = {p.name for p in async_protocols}
-    assert sync_names == async_names
+    assert protocol_names == protocol_names_async
 
     # Test current prices
-    sync_prices = client.get_current_prices(coins=["coingecko:ethereum"])
-    async_prices = await async_client.get_current_prices_async(
-        coins=["coingecko:ethereum"]
-    )
+    sync_prices = client.get_current_prices(coins=ETH_BTC)
+    async_prices = await async_client.get_current_prices_async(coins=ETH_BTC)
 
-    assert sync_prices.model_dump() == async_prices.model_dump()
+    assert sync_prices == async_prices
@@ -0,0 +1,424 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from defillama import DefiLlama
+from defillama import client as client_module
+from defillama import models
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class SlowApi:
+    """Async mock transport handler that holds every request until released"""
+
+    def __init__(self):
+        self.requests = 0
+        self.started = anyio.Event()
+        self.release = anyio.Event()
+
+    async def __call__(self, request):
+        self.requests += 1
+        self.started.set()
+        await self.release.wait()
+        return httpx.Response(200, content=b"1.5")
+
+
+async def test_concurrent_calls_share_one_request():
+    api = SlowApi()
+    async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        calls = [
+            asyncio.create_task(client.get_protocol_tvl_async("aave")) for _ in range(3)
+        ]
+        await api.started.wait()
+        api.release.set()
+        assert await asyncio.gather(*calls) == [1.5, 1.5, 1.5]
+    assert api.requests == 1
+
+
+async def test_cancelling_first_caller_hands_request_to_waiters():
+    api = SlowApi()
+    async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        first = asyncio.create_task(client.get_protocol_tvl_async("aave"))
+        await api.started.wait()
+        second = asyncio.create_task(client.get_protocol_tvl_async("aave"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        api.release.set()
+        # The waiter sends the request itself instead of inheriting the cancellation
+        assert await second == 1.5
+        assert first.cancelled()
+    assert api.requests == 2
+
+
+def test_requests_after_close_raise():
+    client = DefiLlama(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"1"))
+    )
+    assert client.get_protocol_tvl("aave") == 1.0
+    client.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.get_protocol_tvl("aave")
+    with pytest.raises(RuntimeError, match="closed"):
+        client.get_current_prices(["coingecko:bitcoin"])
+    assert not client._clients
+
+
+async def test_async_requests_after_aclose_raise():
+    client = DefiLlama(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"1"))
+    )
+    assert await client.get_protocol_tvl_async("aave") == 1.0
+    await client.aclose()
+    with pytest.raises(RuntimeError, match="closed"):
+        await client.get_protocol_tvl_async("aave")
+    assert not client._async_clients
+
+
+async def test_default_headers():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b"1")
+
+    async with DefiLlama(transport=httpx.MockTransport(handler)) as client:
+        client.get_protocol_tvl("aave")
+        await client.get_protocol_tvl_async("curve")
+    encoding = "br, gzip" if client_module._HAS_BROTLI else "gzip"
+    for request in requests:
+        assert request.headers["Accept-Encoding"] == encoding
+        assert request.headers["User-Agent"] == f"defillama-py/{client_module._VERSION}"
+    assert len(requests) == 2
+
+
+def test_zero_valued_params_are_sent():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"coins": {}})
+
+    with DefiLlama(transport=httpx.MockTransport(handler)) as client:
+        client.get_price_chart(["coingecko:ethereum"], start=0, span=0)
+        client.get_price_percentage_change(["coingecko:ethereum"], timestamp=0)
+    chart, change = (request.url.params for request in requests)
+    assert chart["start"] == "0" and chart["span"] == "0"
+    assert change["timestamp"] == "0"
+
+
+class FlakyApi:
+    """Mock transport handler answering with the given statuses, then 200 forever"""
+
+    def __init__(self, *statuses, headers=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        if self.statuses:
+            return httpx.Response(self.statuses.pop(0), headers=self.headers)
+        return httpx.Response(200, content=b"1.5")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # Record backoff delays instead of waiting them out
+    delays = []
+
+    async def fake_async_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(time, "sleep", delays.append)
+    monkeypatch.setattr(anyio, "sleep", fake_async_sleep)
+    return delays
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retries_until_success(status, sleeps):
+    api = FlakyApi(status, status)
+    with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        assert client.get_protocol_tvl("aave") == 1.5
+    assert api.requests == 3
+    # Exponential backoff plus up to one base of jitter
+    base = DefiLlama._BACKOFF_BASE
+    assert base <= sleeps[0] <= 2 * base
+    assert 2 * base <= sleeps[1] <= 3 * base
+
+
+async def test_async_retries_until_success(sleeps):
+    api = FlakyApi(503, 429)
+    async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        assert await client.get_protocol_tvl_async("aave") == 1.5
+    assert api.requests == 3
+    assert len(sleeps) == 2
+
+
+def test_retry_honours_retry_after(sleeps):
+    api = FlakyApi(429, headers={"Retry-After": "7"})
+    with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        assert client.get_protocol_tvl("aave") == 1.5
+    assert sleeps == [7.0]
+
+
+def test_retry_after_is_capped(sleeps):
+    api = FlakyApi(429, headers={"Retry-After": "3600"})
+    with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        client.get_protocol_tvl("aave")
+    assert sleeps == [DefiLlama._MAX_BACKOFF]
+
+
+def test_exhausted_retries_raise(sleeps):
+    api = FlakyApi(*[503] * 10)
+    with DefiLlama(transport=httpx.MockTransport(api), max_retries=2) as client:
+        with pytest.raises(ValueError, match="503"):
+            client.get_protocol_tvl("aave")
+    assert api.requests == 3
+    assert len(sleeps) == 2
+
+
+async def test_async_exhausted_retries_raise(sleeps):
+    api = FlakyApi(*[429] * 10)
+    async with DefiLlama(transport=httpx.MockTransport(api), max_retries=2) as client:
+        with pytest.raises(ValueError, match="429"):
+            await client.get_protocol_tvl_async("aave")
+    assert api.requests == 3
+    assert len(sleeps) == 2
+
+
+def test_no_retries(sleeps):
+    api = FlakyApi(503)
+    with DefiLlama(transport=httpx.MockTransport(api), max_retries=0) as client:
+        with pytest.raises(ValueError, match="503"):
+            client.get_protocol_tvl("aave")
+    assert api.requests == 1
+    assert sleeps == []
+
+
+def test_other_errors_are_not_retried(sleeps):
+    api = FlakyApi(404)
+    with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        with pytest.raises(ValueError, match="404"):
+            client.get_protocol_tvl("aave")
+    assert api.requests == 1
+    assert sleeps == []
+
+
+class BulkApi:
+    """Async mock transport handler for the per-item bulk helpers
+
+    Longer path segments answer sooner, so results only come back in input order
+    if the helper puts them there. Slugs and chains containing "bad" get a 404.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request):
+        kind, *parts = request.url.path.strip("/").split("/")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await anyio.sleep(0.02 / len(parts[-1]))
+        finally:
+            self.in_flight -= 1
+        if any("bad" in part for part in parts):
+            return httpx.Response(404)
+        if kind == "protocol":
+            body = json.loads((FIXTURES / "protocol.json").read_bytes())
+            return httpx.Response(200, json={**body, "name": parts[0]})
+        if kind == "tvl":
+            return httpx.Response(200, content=str(len(parts[0])).encode())
+        chain, timestamp = parts
+        return httpx.Response(200, json={"height": len(chain), "timestamp": timestamp})
+
+
+async def test_bulk_results_keep_input_order():
+    api = BulkApi()
+    slugs = [f"protocol-{'x' * i}" for i in range(8)]
+    async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        details = await client.get_protocols_bulk_async(slugs, concurrency=3)
+        tvls = await client.get_protocol_tvls_bulk_async(slugs, concurrency=3)
+    assert [d.name for d in details] == slugs
+    assert tvls == [float(len(slug)) for slug in slugs]
+    assert api.max_in_flight <= 3
+
+
+async def test_bulk_failures_stay_in_their_slot():
+    api = BulkApi()
+    slugs = ["aave", "bad-slug", "uniswap"]
+    async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        tvls = await client.get_protocol_tvls_bulk_async(slugs, concurrency=2)
+        details = await client.get_protocols_bulk_async(slugs, concurrency=2)
+    assert tvls[0] == 4.0 and tvls[2] == 7.0
+    assert isinstance(tvls[1], ValueError) and "404" in str(tvls[1])
+    assert isinstance(details[1], ValueError)
+    assert [details[0].name, details[2].name] == ["aave", "uniswap"]
+
+
+async def test_blocks_bulk_unpacks_queries():
+    api = BulkApi()
+    queries = [("Ethereum", 1700000000), ("arbitrum", 1700000001), ("bad", 1)]
+    async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        blocks = await client.get_blocks_bulk_async(queries, concurrency=2)
+    assert [(b.height, b.timestamp) for b in blocks[:2]] == [
+        (8, 1700000000),
+        (8, 1700000001),
+    ]
+    assert isinstance(blocks[2], ValueError)
+
+
+def test_async_methods_run_under_trio(sleeps):
+    pytest.importorskip("trio")
+
+    async def main():
+        api = SlowApi()
+        async with DefiLlama(transport=httpx.MockTransport(api)) as client:
+            results = []
+
+            async def call():
+                results.append(await client.get_protocol_tvl_async("aave"))
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(call)
+                await api.started.wait()
+                api.release.set()
+        assert results == [1.5, 1.5, 1.5]
+        assert api.requests == 1
+
+        flaky = FlakyApi(503)
+        async with DefiLlama(transport=httpx.MockTransport(flaky)) as client:
+            assert await client.get_protocol_tvl_async("aave") == 1.5
+        assert flaky.requests == 2
+
+        async with DefiLlama(transport=httpx.MockTransport(BulkApi())) as client:
+            tvls = await client.get_protocol_tvls_bulk_async(["aave", "bad", "curve"])
+        assert tvls[0] == 4.0 and tvls[2] == 5.0
+        assert isinstance(tvls[1], ValueError)
+
+    anyio.run(main, backend="trio")
+
+
+def price_api(requests):
+    """Mock transport handler pricing every coin in the URL, failing on "bad" ones"""
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/batchHistorical":
+            coins = json.loads(request.url.params["coins"])
+            body = {
+                coin: {"symbol": "X", "prices": [{"timestamp": ts, "price": 1.0}]}
+                for coin, timestamps in coins.items()
+                for ts in timestamps
+            }
+        else:
+            coins = request.url.path.rsplit("/", 1)[-1].split(",")
+            body = {coin: {"price": 1.0, "symbol": "X"} for coin in coins}
+        if any("bad" in coin for coin in coins):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"coins": body})
+
+    return handler
+
+
+def test_batch_coins_splits_on_size_and_url_length():
+    assert DefiLlama._batch_coins(list("abcde"), 2) == [["a", "b"], ["c", "d"], ["e"]]
+    long_coin = "x" * (DefiLlama._MAX_COINS_URL_LENGTH // 2 - 1)
+    batches = DefiLlama._batch_coins([long_coin] * 5, 100)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+async def test_bulk_prices_merge_batches():
+    requests = []
+    coins = [f"coingecko:coin-{i}" for i in range(5)]
+    async with DefiLlama(transport=httpx.MockTransport(price_api(requests))) as client:
+        prices = await client.get_current_prices_bulk_async(coins, batch_size=2)
+    assert len(requests) == 3
+    assert sorted(prices.coins) == sorted(coins)
+
+
+async def test_bulk_prices_raise_first_failed_batch():
+    requests = []
+    coins = ["coingecko:a", "coingecko:b", "coingecko:bad"]
+    async with DefiLlama(transport=httpx.MockTransport(price_api(requests))) as client:
+        with pytest.raises(ValueError, match="404"):
+            await client.get_first_prices_bulk_async(coins, batch_size=1)
+
+
+async def test_batch_historical_urls_stay_within_budget():
+    requests = []
+    coins = {
+        f"ethereum:0x{i:040x}": [1666876743 + n for n in range(5)] for i in range(60)
+    }
+    async with DefiLlama(transport=httpx.MockTransport(price_api(requests))) as client:
+        prices = await client.get_batch_historical_prices_bulk_async(coins)
+    assert len(prices.coins) == len(coins)
+    assert len(requests) > 1
+    for request in requests:
+        # Everything but "coins=" and the encoded braces counts against the budget
+        assert len(request.url.query) <= DefiLlama._MAX_COINS_URL_LENGTH + 12
+
+
+class ChunkedApi:
+    """Mock transport handler streaming fixture bodies a few bytes at a time"""
+
+    ROUTES = {
+        "/protocols": "protocols",
+        "/stablecoincharts/all": "stablecoin_charts",
+        "/pools": "pools",
+    }
+
+    def __init__(self, chunk_size=16):
+        self.chunk_size = chunk_size
+        self.chunks_sent = 0
+
+    def __call__(self, request):
+        name = self.ROUTES.get(request.url.path)
+        if name is None:
+            return httpx.Response(404)
+        body = (FIXTURES / f"{name}.json").read_bytes()
+        return httpx.Response(200, content=self._chunks(body))
+
+    def _chunks(self, body):
+        for start in range(0, len(body), self.chunk_size):
+            self.chunks_sent += 1
+            yield body[start : start + self.chunk_size]
+
+
+@pytest.mark.parametrize(
+    "method, model, count",
+    [
+        ("iter_protocols", models.Protocol, 2),
+        ("iter_stablecoin_charts", models.StablecoinChart, 2),
+        ("iter_pools", models.Pool, 2),
+    ],
+)
+def test_iter_streams_every_item(method, model, count):
+    with DefiLlama(transport=httpx.MockTransport(ChunkedApi())) as client:
+        items = list(getattr(client, method)())
+    assert len(items) == count
+    assert all(isinstance(item, model) for item in items)
+
+
+def test_iter_stops_downloading_when_abandoned():
+    api = ChunkedApi()
+    with DefiLlama(transport=httpx.MockTransport(api)) as client:
+        protocols = client.iter_protocols()
+        assert next(protocols).name == "AAVE V3"
+        protocols.close()
+    total = -(-len((FIXTURES / "protocols.json").read_bytes()) // api.chunk_size)
+    assert api.chunks_sent < total
+
+
+def test_iter_raises_on_http_error():
+    with DefiLlama(transport=httpx.MockTransport(ChunkedApi())) as client:
+        with pytest.raises(ValueError, match="404"):
+            next(client.iter_stablecoin_charts(chain="Nowhere"))